@@ -185,8 +185,25 @@ def load_dialogue(fname):
 TITLE = "A Death at Sea"
 WIDTH = 800
 HEIGHT = 600
+
+# Run update() at a fixed rate so walking speed doesn't depend on the frame
+# rate; FPS may be lowered on slow machines.
+UPDATE_RATE = 60
+FPS = 60
 FONT = "travelling_typewriter"
 
+# Text styles, resolved once rather than on every draw
+LABELS = {
+    color: TextStyle(fontname=FONT, fontsize=20, color=color)
+    for color in ('#cccccc', '#aaaaaa', 'white', '#ff4444', '#aa0000',
+                  '#cc4466', '#66cc44')
+}
+LABEL = LABELS['#cccccc']
+HINT = TextStyle(fontname=FONT, fontsize=14, color='#aaaaaa')
+SPEECH = TextStyle(fontname=FONT, fontsize=18, color='#cccccc', width=WIDTH - 60)
+PROMPT = TextStyle(fontname=FONT, fontsize=18, color='white')
+SLIDE = TextStyle(fontname=FONT, fontsize=22, color='#cccccc', align='center')
+
 # All NPCs are anchored at center bottom
 CANC = ('center', 'bottom')
 
@@ -264,7 +281,7 @@ captain.name = "The Captain"
 lift = Actor('lift', pos=(80, 400))
 
 
-# Maximum walk speed
+# Maximum walk speed, in pixels per update
 MAX_WALK = 3
 billy = Actor(
     'billy-standing',
@@ -339,6 +356,26 @@ class Door(InteractableIf):
 
 current_music = None
 
+# The task rendering the current deck's captions ahead of time
+caption_task = None
+
+
+def talk_caption(actor):
+    return 'Talk to %s' % actor.name
+
+
+def warm_captions(deck):
+    """Render the captions that can be shown on a deck, one a frame.
+
+    Walking up to something then never has to render its caption first.
+
+    """
+    captions = [talk_caption(a) for a in deck.actors]
+    captions += [o.caption() for o in deck.objects]
+    for caption in captions:
+        yield clock.wait(0)
+        LABEL.draw(caption, midtop=CAPTION_POS, surf=None)
+
 
 def enter(deck, pos=None):
     """Enter the given deck/room at the given x pos."""
@@ -348,11 +385,10 @@ def enter(deck, pos=None):
         screen.draw.text(
             current_deck.name,
             topright=(WIDTH - 10, 10),
-            fontname=FONT,
-            fontsize=20,
-            color='#cccccc'
+            style=LABEL
         )
     current_deck = deck
+    build_deck_layer()
     if pos is not None:
         billy.real_x = pos
     if current_deck.width < WIDTH:
@@ -454,6 +490,12 @@ current_deck = deck3_start
 
 viewport = (0, 0)
 
+# The current deck with its NPCs drawn on: (deck_layer_key(), surface, x)
+deck_layer = None
+
+# What draw_deck() last left in the PANEL: (vx, Billy's rect)
+deck_view = None
+
 for d in all_deck_objects:
     d.level_width = d.width
 deck1.level_width -= 312
@@ -491,17 +533,20 @@ game_screen = None
 TITLE_BAR = Rect(0, 0, WIDTH, 50)
 PANEL = Rect(0, 50, WIDTH, 145)
 TEXT_AREA = Rect(0, 195, WIDTH, HEIGHT - 195)
+CAPTION_POS = WIDTH // 2, 220
 BLACK = 0, 0, 0
 
 
 
 def draw():
-    global has_screen
+    global has_screen, deck_view
     has_screen = True
     if game_screen:
+        deck_view = None
         return game_screen.draw()
 
     if billy.in_lift:
+        deck_view = None
         draw_lift()
     else:
         draw_deck()
@@ -513,9 +558,7 @@ def draw_lift():
     screen.draw.text(
         'Deck %s: %s' % (deck_num or "A", current_deck.name),
         midleft=(lift.x + 60, lift.y),
-        fontname=FONT,
-        fontsize=20,
-        color='#cccccc'
+        style=LABEL
     )
 
 
@@ -523,17 +566,100 @@ def clear_text_area():
     screen.draw.filled_rect(TEXT_AREA, BLACK)
 
 
+MENU_ROW_HEIGHT = 30
+
+
+def menu_row(width, style, texts, **pos):
+    """Pre-draw a row of a menu, as texts drawn over a black strip.
+
+    The strip is opaque, so blitting it repaints the row with no need to
+    clear it first.
+
+    """
+    row = pygame.Surface((width, MENU_ROW_HEIGHT)).convert()
+    row.fill(BLACK)
+    for text in texts:
+        style.draw(text, surf=row, **pos)
+    return row
+
+
+def deck_layer_key():
+    """Identify the current deck and the state of its NPCs."""
+    return id(current_deck), [
+        (id(a), a.image, a.real_x) for a in current_deck.actors
+    ]
+
+
+def build_deck_layer():
+    """Pre-draw the current deck and its NPCs into a single opaque surface.
+
+    NPCs don't move in normal play, so each frame just needs one blit from
+    this and then Billy drawn on top.
+
+    """
+    global deck_layer, deck_view, caption_task
+    if deck_layer is None or deck_layer[0][0] != id(current_deck):
+        if caption_task:
+            caption_task.cancel()
+        caption_task = clock.start_task(warm_captions(current_deck))
+    w = current_deck.width
+    ox = -(WIDTH - w) // 2 if w < WIDTH else 0
+    surf = pygame.Surface((max(w, WIDTH), PANEL.height)).convert()
+    surf.fill(BLACK)
+    surf.blit(images.load(current_deck.image), (-ox, 0))
+    for a in current_deck.actors:
+        # Position the actor as draw_deck() would, so it is rounded the same
+        # way, then put it back where it was
+        topleft = a.topleft
+        a.pos = a.real_x - ox, 186 - PANEL.top
+        surf.blit(images.load(a.image), a.topleft)
+        a.topleft = topleft
+    deck_layer = deck_layer_key(), surf, ox
+    deck_view = None
+
+
 def draw_deck():
-    screen.draw.filled_rect(PANEL, BLACK)
+    """Draw the deck, its NPCs and Billy into the PANEL.
+
+    If the PANEL still shows this deck from the last frame, only the parts
+    that have changed are redrawn: the deck is scrolled to the new viewport,
+    leaving just the newly exposed strip to draw, and the area where Billy
+    was is painted over.
+
+    """
+    global deck_view
+    if deck_layer is None or deck_layer[0] != deck_layer_key():
+        build_deck_layer()
     vx, vy = viewport
-    current_deck.left = -vx
-    current_deck.top = 50
-    current_deck.draw()
-    for a in current_deck.actors:
-        a.pos = a.real_x - vx, 186
-        a.draw()
+    if deck_view and abs(vx - deck_view[0]) < WIDTH:
+        last_vx, last_billy = deck_view
+        dx = last_vx - vx
+        if dx:
+            screen.scroll(dx, 0, PANEL)
+            if dx > 0:
+                strip = Rect(PANEL.left, PANEL.top, dx, PANEL.height)
+            else:
+                strip = Rect(PANEL.right + dx, PANEL.top, -dx, PANEL.height)
+            draw_deck_area(strip)
+        draw_deck_area(last_billy.move(dx, 0).clip(PANEL))
+    else:
+        dx = True
+        draw_deck_area(PANEL)
+    if dx:
+        for a in current_deck.actors:
+            a.pos = a.real_x - vx, 186
     billy.x = billy.real_x - vx
     billy.draw()
+    deck_view = vx, Rect(billy)
+
+
+def draw_deck_area(area):
+    """Draw the deck and its NPCs within the given area of the screen."""
+    if not area:
+        return
+    key, layer, ox = deck_layer
+    vx, vy = viewport
+    screen.blit(layer, area.topleft, area.move(vx - ox, -PANEL.top))
 
 
 action_caption = None
@@ -544,7 +670,7 @@ def update_action_caption():
     new_caption = None
     for a in current_deck.actors:
         if billy.colliderect(a):
-            new_caption = 'Talk to %s' % a.name
+            new_caption = talk_caption(a)
             break
     else:
         for o in current_deck.objects:
@@ -556,25 +682,29 @@ def update_action_caption():
         if new_caption:
             draw_caption(new_caption)
         action_caption = new_caption
+        return True
+    return False
 
 
 def draw_caption(caption):
     screen.draw.text(
         caption,
-        midtop=(WIDTH // 2, 220),
-        fontname=FONT,
-        fontsize=20,
-        color='#cccccc'
+        midtop=CAPTION_POS,
+        style=LABEL
     )
 
 
 def update():
+    """Update the game, returning False if nothing needs redrawing."""
     if not billy.dialogue_with and not game_screen:
-        move_billy()
-        update_action_caption()
+        moved = move_billy()
+        caption_changed = update_action_caption()
+        return moved or caption_changed
+    return False
 
 
 def move_billy():
+    """Move Billy according to the keys held; return True if he walked."""
     global frame, viewport
     if keyboard.left:
         billy.real_x -= MAX_WALK
@@ -594,6 +724,7 @@ def move_billy():
             billy.dir = 'r'
     else:
         stop_billy_anim()
+        return False
 
     if current_deck.width > WIDTH:
         vx, vy = viewport
@@ -604,6 +735,7 @@ def move_billy():
         if billy.real_x < vx + l_edge:
             vx = max(billy.real_x - l_edge, 0)
         viewport = vx, vy
+    return True
 
 
 billy_walk_r = [
@@ -706,6 +838,8 @@ class DialogueChoices:
     def __init__(self, options, parent=None):
         self.options = options
         self.parent = parent
+        # Pre-drawn rows, by (choice, whether done, whether selected)
+        self.rows = {}
 
     def start(self):
         if self.parent is None:
@@ -745,63 +879,81 @@ class DialogueChoices:
 
     MAX_SHOW = 11
 
+    # The areas of the screen for the scroll arrows, and for the choices
+    ARROWS = Rect(0, 230, 60, 30 * MAX_SHOW + 10)
+    LIST = Rect(60, 230, WIDTH - 60, MENU_ROW_HEIGHT * MAX_SHOW)
+
     def draw(self):
         clear_text_area()
-        choices = self.choices[self.offset:self.offset + self.MAX_SHOW]
+        self.draw_arrows()
+        for choice_num in range(self.offset, self.offset + self.MAX_SHOW):
+            self.draw_row(choice_num)
+
+    def draw_arrows(self):
+        screen.draw.filled_rect(self.ARROWS, BLACK)
         if self.offset > 0:
             screen.draw.text(
                 '/\\',
                 topleft=(30, 230),
-                fontname=FONT,
-                fontsize=14,
-                color='#aaaaaa'
+                style=HINT
             )
-        for i, opt in enumerate(choices):
-            choice_num = i + self.offset
-            key, is_done = opt
-            if is_done:
-                color = '#ff4444' if choice_num == self.selected else '#aa0000'
-            else:
-                color = '#aaaaaa' if choice_num != self.selected else 'white'
-            screen.draw.text(
-                key,
-                bottomleft=(60, 260 + 30 * i),
-                fontname=FONT,
-                fontsize=20,
-                color=color
-            )
-            if is_done:
-                screen.draw.text(
-                    '-' * int(len(key) * 1.6),
-                    bottomleft=(60, 260 + 30 * i),
-                    fontname=FONT,
-                    fontsize=20,
-                    color=color
-                )
         if self.offset + self.MAX_SHOW < len(self.choices):
             screen.draw.text(
                 '\/',
                 bottomleft=(30, 240 + 30 * self.MAX_SHOW),
-                fontname=FONT,
-                fontsize=14,
-                color='#aaaaaa'
+                style=HINT
             )
 
+    def draw_row(self, choice_num):
+        """Draw a choice, if it is scrolled into view."""
+        i = choice_num - self.offset
+        if not 0 <= i < self.MAX_SHOW or choice_num >= len(self.choices):
+            return
+        key, is_done = self.choices[choice_num]
+        selected = choice_num == self.selected
+        row = self.rows.get((key, is_done, selected))
+        if row is None:
+            if is_done:
+                color = '#ff4444' if selected else '#aa0000'
+                texts = key, '-' * int(len(key) * 1.6)
+            else:
+                color = 'white' if selected else '#aaaaaa'
+                texts = key,
+            row = menu_row(self.LIST.width, LABELS[color], texts, bottomleft=(0, MENU_ROW_HEIGHT))
+            self.rows[key, is_done, selected] = row
+        screen.blit(row, (self.LIST.left, self.LIST.top + MENU_ROW_HEIGHT * i))
+
+    def move(self, last_selected, last_offset):
+        """Repaint the rows changed by moving the selection."""
+        shift = self.offset - last_offset
+        if abs(shift) > 1:
+            self.draw()
+            return
+        if shift:
+            # Move the rows still in view, then fill in the one scrolled in
+            screen.scroll(0, -MENU_ROW_HEIGHT * shift, self.LIST)
+            self.draw_arrows()
+            self.draw_row(self.offset if shift < 0 else self.offset + self.MAX_SHOW - 1)
+        self.draw_row(last_selected)
+        self.draw_row(self.selected)
+
     def up(self):
+        last_selected, last_offset = self.selected, self.offset
         self.selected = (self.selected - 1) % len(self.choices)
         if self.selected < self.offset:
             self.offset = max(self.selected, 0)
         elif self.selected >= self.offset + self.MAX_SHOW:
             self.offset = min(self.selected, len(self.choices) - self.MAX_SHOW)
-        self.draw()
+        self.move(last_selected, last_offset)
 
     def down(self):
+        last_selected, last_offset = self.selected, self.offset
         self.selected = (self.selected + 1) % len(self.choices)
         if self.selected >= self.offset + self.MAX_SHOW:
             self.offset = min(self.selected - self.MAX_SHOW + 1, len(self.choices) - self.MAX_SHOW)
         elif self.selected < self.offset:
             self.offset = max(self.selected, 0)
-        self.draw()
+        self.move(last_selected, last_offset)
 
     def select(self):
         key, done = self.choices[self.selected]
@@ -812,10 +964,71 @@ class DialogueChoices:
         billy.dialogue_menu = DialogueChat(steps, self)
 
 
+class Typewriter:
+    """Reveal text a character at a time, as if it were being typed.
+
+    The text is rendered once, and as each character is typed it is blitted
+    from that one surface, so partly typed text is never rendered.
+
+    """
+    RATE = 60  # characters per second
+
+    def __init__(self, text, style, topleft, rate=RATE):
+        self.surf = style.getsurf(text)
+        self.topleft = topleft
+        self.rate = rate
+        font = style.getfont()
+        # The area of the surface for each character, in the order typed
+        self.areas = []
+        for line, x, y in style.getlines(text):
+            h = font.size(line)[1]
+            left = 0
+            for k in range(1, len(line) + 1):
+                right = font.size(line[:k])[0]
+                self.areas.append(Rect(x + left, y, right - left, h))
+                left = right
+        self.shown = 0
+        self.t = 0
+        clock.each_tick(self.type)
+
+    @property
+    def done(self):
+        return self.shown == len(self.areas)
+
+    def type(self, dt):
+        self.t += dt
+        self.reveal(min(int(self.t * self.rate), len(self.areas)))
+
+    def finish(self):
+        """Show the rest of the text at once."""
+        self.reveal(len(self.areas))
+
+    def reveal(self, n):
+        """Show the text up to the nth character."""
+        # Blit each line's newly typed characters together
+        runs = OrderedDict()
+        for area in self.areas[self.shown:n]:
+            run = runs.get(area.y)
+            runs[area.y] = area if run is None else run.union(area)
+        x, y = self.topleft
+        for area in runs.values():
+            screen.blit(self.surf, (x + area.x, y + area.y), area)
+        self.shown = max(n, self.shown)
+        if self.done:
+            self.stop()
+
+    def stop(self):
+        clock.unschedule(self.type)
+
+
 class DialogueChat:
+    # How many pages of text to render ahead while the player reads
+    LOOKAHEAD = 2
+
     def __init__(self, steps, parent):
         self.steps = steps[:]
         self.parent = parent
+        self.typewriter = None
         self.select()
 
     def draw(self):
@@ -825,37 +1038,27 @@ class DialogueChat:
             screen.draw.text(
                 'Billy',
                 bottomleft=(30, 230),
-                fontname=FONT,
-                fontsize=20,
-                color=color
+                style=LABELS[color]
             )
         elif self.action == 'THEY':
             color = '#66cc44'
             screen.draw.text(
                 billy.dialogue_with.name,
                 bottomright=(WIDTH - 30, 230),
-                fontname=FONT,
-                fontsize=20,
-                color=color
+                style=LABELS[color]
             )
-        screen.draw.text(
-            self.text,
-            topleft=(30, 250),
-            width=WIDTH - 60,
-            fontname=FONT,
-            fontsize=18,
-            color='#cccccc'
-        )
+        self.typewriter = Typewriter(self.text, SPEECH, (30, 250))
         screen.draw.text(
             "Continue",
             bottomright=(WIDTH - 30, HEIGHT - 30),
-            fontname=FONT,
-            fontsize=18,
-            color='white'
+            style=PROMPT
         )
 
     def select(self):
-        """Proceed to the next step."""
+        """Proceed to the next step, or finish typing this one."""
+        if self.typewriter and not self.typewriter.done:
+            self.typewriter.finish()
+            return
         while True:
             try:
                 action, text = self.steps.pop(0)
@@ -883,6 +1086,18 @@ class DialogueChat:
                 SaveMenu.autosave()
         else:
             self.draw()
+            # Run on the next frame, once this page is on screen
+            clock.schedule_unique(self.prerender, 0)
+
+    def prerender(self):
+        """Render the next pages, so that turning to them is just a blit."""
+        pages = 0
+        for action, text in self.steps:
+            if action == 'EXIT' or pages == self.LOOKAHEAD:
+                break
+            if action in ('YOU', 'THEY'):
+                SPEECH.getsurf(text)
+                pages += 1
 
     def up(self):
         """no-op."""
@@ -930,6 +1145,8 @@ def show_menu():
 class GameMenu:
     def __init__(self):
         self.selected = 0
+        # Pre-drawn rows, by (choice number, whether selected)
+        self.rows = {}
 
     def show(self):
         billy.dialogue_with = billy.dialogue_menu = self
@@ -937,23 +1154,32 @@ class GameMenu:
 
     def draw(self):
         clear_text_area()
-        for i, opt in enumerate(self.choices):
-            color = '#aaaaaa' if i != self.selected else 'white'
-            screen.draw.text(
-                opt,
-                midtop=(WIDTH // 2, 260 + 30 * i),
-                fontname=FONT,
-                fontsize=20,
-                color=color
-            )
+        for i in range(len(self.choices)):
+            self.draw_row(i)
+
+    def draw_row(self, i):
+        selected = i == self.selected
+        row = self.rows.get((i, selected))
+        if row is None:
+            style = LABELS['white' if selected else '#aaaaaa']
+            row = menu_row(WIDTH, style, (self.choices[i],), midtop=(WIDTH // 2, 0))
+            self.rows[i, selected] = row
+        screen.blit(row, (0, 260 + MENU_ROW_HEIGHT * i))
+
+    def move(self, last_selected):
+        """Repaint the rows changed by moving the selection."""
+        self.draw_row(last_selected)
+        self.draw_row(self.selected)
 
     def up(self):
+        last_selected = self.selected
         self.selected = (self.selected - 1) % len(self.choices)
-        self.draw()
+        self.move(last_selected)
 
     def down(self):
+        last_selected = self.selected
         self.selected = (self.selected + 1) % len(self.choices)
-        self.draw()
+        self.move(last_selected)
 
     def select(self):
         choice = self.choices[self.selected]
@@ -1107,7 +1333,6 @@ class IntroScreen:
         self.moon_images = cycle(['moon1', 'moon2', 'moon3'])
         self.ship = Actor('ship1', anchor=('right', 'center'), pos=(100, 140))
         self.moon = Actor('moon1', topleft=(615, 147), anchor=('left', 'top'))
-        self.itexts = iter(self.texts)
         self.drawn = False
 
     def show(self):
@@ -1115,8 +1340,7 @@ class IntroScreen:
         game_screen = self
         clock.schedule_interval(self.update_ship, 0.1)
         clock.schedule_interval(self.update_moon, 0.3)
-        clock.schedule_unique(self.next_text, 5)
-        self.next_text()
+        self.task = clock.start_task(self.play())
         music.play(self.MUSIC)
         billy.dialogue_with = billy.dialogue_menu = self
 
@@ -1149,25 +1373,29 @@ class IntroScreen:
         if not self.drawn:
             screen.draw.text(
                 self.text,
-                midtop=(WIDTH // 2, 350 - (self.text.count('\n') + 1) // 2 * 22),
-                fontname=FONT,
-                fontsize=22,
-                color='#cccccc',
-                align='center'
+                midtop=self.text_pos(self.text),
+                style=SLIDE
             )
             self.drawn = True
 
-    def next_text(self):
-        try:
-            self.text = next(self.itexts)
-        except StopIteration:
-            self.end()
-        else:
+    def text_pos(self, text):
+        """Get the midtop of a slide's text, centring it on the screen."""
+        return WIDTH // 2, 350 - (text.count('\n') + 1) // 2 * 22
+
+    def play(self):
+        """Show each slide in turn, then end."""
+        for text in self.texts:
+            self.text = text
             self.drawn = False
-            clock.schedule_unique(self.next_text, self.slide_time)
+            self.skip = False
+            yield clock.until(lambda: self.skip, timeout=self.slide_time)
+        self.end()
 
     def end(self):
         global game_screen
+        self.task.cancel()
+        clock.unschedule(self.update_ship)
+        clock.unschedule(self.update_moon)
         music.stop()
         game_screen = None
         billy.dialogue_with = billy.dialogue_menu = None
@@ -1177,7 +1405,7 @@ class IntroScreen:
         self.end()
 
     def select(self):
-        self.next_text()
+        self.skip = True
 
 
     def up(self):
@@ -1212,12 +1440,12 @@ class Ending(IntroScreen):
         super().__init__()
 
     def end(self):
+        self.task.cancel()
+        self.text = ''
+        self.drawn = False
         theend = 'The End'
-        spelling = [theend[:n] for n in range(len(theend) + 1)]
-        self.texts = spelling
-        self.itexts = iter(spelling)
-        clock.schedule_unique(self.next_text, 0.1)
-        self.slide_time = 0.1
+        tsurf, pos = SLIDE.draw(theend, midtop=self.text_pos(theend), surf=None)
+        self.typewriter = Typewriter(theend, SLIDE, pos, rate=10)
         self.end = lambda: None
 
 
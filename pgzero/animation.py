@@ -6,8 +6,20 @@ from math import sin, pow, pi
 
 from .clock import each_tick, unschedule
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 TWEEN_FUNCTIONS = {}
 
+# Groups of at least this many animations sharing a tween function have
+# their progress evaluated in one vectorised step (if numpy is available)
+BATCH_THRESHOLD = 16
+
+# Number of samples in the lookup tables used to tween batches
+TWEEN_TABLE_SIZE = 1024
+
 
 def tweener(f):
     TWEEN_FUNCTIONS[f.__name__] = f
@@ -122,6 +134,84 @@ def tween_attr(n, start, end):
         return tween(n, start, end)
 
 
+_tween_tables = {}
+
+
+def tween_table(function):
+    """Get a precomputed lookup table of samples of a tween function.
+
+    Returns a pair of numpy arrays (progress, value) suitable for passing to
+    numpy.interp().
+
+    """
+    try:
+        return _tween_tables[function]
+    except KeyError:
+        xs = numpy.linspace(0.0, 1.0, TWEEN_TABLE_SIZE)
+        ys = numpy.array([function(x) for x in xs])
+        _tween_tables[function] = xs, ys
+        return xs, ys
+
+
+# Running animations, grouped by tween function. Each group is a dict used
+# as an insertion-ordered set, so that removal is O(1).
+_groups = {}
+
+# Running animations by id(object), then by attribute name. An attribute is
+# only ever animated by one animation at a time.
+_registry = {}
+
+
+def _failed(anim):
+    """Report the exception raised while advancing anim, and stop it.
+
+    The other animations share the same clock callback, so they must not be
+    stopped by one of them failing.
+
+    """
+    import traceback
+    traceback.print_exc()
+    if anim.running:
+        anim.stop()
+
+
+def _update_group(function, group, dt):
+    """Advance a group of animations that share a tween function."""
+    if numpy is None or len(group) < BATCH_THRESHOLD:
+        for anim in group:
+            if anim.running:
+                try:
+                    anim.update(dt)
+                except Exception:
+                    _failed(anim)
+        return
+
+    ts = numpy.array([a.t for a in group]) + dt
+    ns = ts / numpy.array([a.duration for a in group])
+    values = numpy.interp(ns, *tween_table(function))
+    for anim, t, n, v in zip(group, ts.tolist(), ns.tolist(), values.tolist()):
+        if not anim.running:
+            continue
+        anim.t = t
+        try:
+            if n > 1:
+                anim._finish()
+            else:
+                anim._apply(v)
+        except Exception:
+            _failed(anim)
+
+
+def _update_animations(dt):
+    """Advance all running animations.
+
+    This is the only clock callback for animations, however many are running.
+
+    """
+    for function, group in list(_groups.items()):
+        _update_group(function, list(group), dt)
+
+
 class Animation:
     """An animation manager for object attribute animations.
 
@@ -132,11 +222,15 @@ class Animation:
     If the value is a list or tuple, then each value inside that will
     be tweened.
 
-    The update() method is automatically scheduled with the clock for
-    the duration of the animation.
+    All running animations are advanced together by a single clock
+    callback, which batches animations that share a tween function.
+
+    Starting an animation of an attribute that is already being animated
+    supersedes the earlier animation for that attribute.
 
     """
-    animations = []
+    # The running animations; a dict used as an insertion-ordered set
+    animations = {}
 
     def __init__(self, object, tween='linear', duration=1, on_finished=None,
                  **targets):
@@ -154,23 +248,49 @@ class Animation:
             except AttributeError:
                 raise ValueError('object %r has no attribute %s to animate' % (object, k))
             self.initial[k] = a
-        each_tick(self.update)
-        self.animations.append(self)
+
+        attrs = _registry.setdefault(id(object), {})
+        for k in list(self.targets):
+            previous = attrs.get(k)
+            if previous is not None:
+                previous._remove_target(k)
+            attrs[k] = self
+
+        if not _groups:
+            each_tick(_update_animations)
+        _groups.setdefault(self.function, {})[self] = None
+        self.animations[self] = None
 
     def update(self, dt):
         self.t += dt
         n = self.t / self.duration
         if n > 1:
-            n = 1
-            self.stop(complete=True)
-            if self.on_finished is not None:
-                self.on_finished()
+            self._finish()
             return
-        n = self.function(n)
+        self._apply(self.function(n))
+
+    def _apply(self, n):
+        """Set the targets to their values at tweened progress n."""
         for k in self.targets:
             v = tween_attr(n, self.initial[k], self.targets[k])
             setattr(self.object, k, v)
 
+    def _remove_target(self, k):
+        """Stop animating attribute k, which another animation now owns.
+
+        If no targets remain, the animation is stopped.
+
+        """
+        del self.targets[k]
+        del self.initial[k]
+        if not self.targets:
+            self.stop()
+
+    def _finish(self):
+        self.stop(complete=True)
+        if self.on_finished is not None:
+            self.on_finished()
+
     def stop(self, complete=False):
         """Stop the animation, optionally completing the transition to the final
         property values.
@@ -180,14 +300,36 @@ class Animation:
             targets will be set to some value between the start and
             end values.
         """
+        if not self.running:
+            return
         self.running = False
         if complete:
             for k in self.targets:
                 setattr(self.object, k, self.targets[k])
-        unschedule(self.update)
-        self.animations.remove(self)
+        attrs = _registry[id(self.object)]
+        for k in self.targets:
+            if attrs.get(k) is self:
+                del attrs[k]
+        if not attrs:
+            del _registry[id(self.object)]
+
+        group = _groups[self.function]
+        del group[self]
+        if not group:
+            del _groups[self.function]
+            if not _groups:
+                unschedule(_update_animations)
+        del self.animations[self]
 
 
 def animate(object, tween='linear', duration=1, on_finished=None, **targets):
     return Animation(object, tween, duration, on_finished=on_finished,
                      **targets)
+
+
+def get_animations(object):
+    """Get the running animations of attributes of the given object."""
+    attrs = _registry.get(id(object))
+    if not attrs:
+        return []
+    return list(dict.fromkeys(attrs.values()))
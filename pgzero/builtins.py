@@ -5,9 +5,10 @@ from .actor import Actor
 from .keyboard import keyboard
 from .animation import animate
 from .rect import Rect, ZRect
+from .ptext import TextStyle
 
 from .loaders import images, sounds
 
 from .constants import mouse, keys, keymods
 
-from .game import exit
+from .game import exit, resize_window
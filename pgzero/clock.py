@@ -5,12 +5,15 @@ classes in Pyglet.
 
 """
 import heapq
+import asyncio
+from itertools import count
 from weakref import ref
 from functools import total_ordering
 from types import MethodType
 
 __all__ = [
-    'Clock', 'schedule', 'schedule_interval', 'unschedule'
+    'Clock', 'schedule', 'schedule_interval', 'unschedule',
+    'start_task', 'wait', 'until', 'sleep'
 ]
 
 
@@ -60,6 +63,57 @@ class Event:
         return self.cb()
 
 
+class Wait:
+    """Suspend a task for a fixed delay (in clock time / seconds)."""
+    def __init__(self, delay):
+        self.delay = delay
+
+
+class Until:
+    """Suspend a task until a condition becomes true.
+
+    If timeout is given, the task resumes after that many seconds even if the
+    condition is still false.
+
+    """
+    def __init__(self, condition, timeout=None):
+        self.condition = condition
+        self.timeout = timeout
+
+
+def wait(delay):
+    """Yield this from a task to pause it for `delay` seconds."""
+    return Wait(delay)
+
+
+def until(condition, timeout=None):
+    """Yield this from a task to pause it until `condition()` is true.
+
+    The yield expression evaluates to True if the condition was met, or False
+    if the timeout expired first.
+
+    """
+    return Until(condition, timeout)
+
+
+class Task:
+    """A generator-based task driven by a Clock.
+
+    The generator yields wait() or until() objects to suspend itself; yielding
+    None suspends it until the next tick.
+
+    """
+    def __init__(self, gen):
+        self.gen = gen
+        self.running = True
+        self.condition = None
+        self.deadline = None
+
+    def cancel(self):
+        """Stop the task; it will not be resumed again."""
+        self.running = False
+
+
 class Clock:
     """A clock used for event scheduling.
 
@@ -79,6 +133,9 @@ class Clock:
         self.fired = False
         self.events = []
         self._each_tick = []
+        self._tasks = []
+        self._polling = []
+        self._task_seq = count()
 
     def schedule(self, callback, delay):
         """Schedule callback to be called once, at `delay` seconds from now.
@@ -122,6 +179,24 @@ class Clock:
         heapq.heapify(self.events)
         self._each_tick = [e for e in self._each_tick if e() != callback]
 
+    def next_event_delay(self):
+        """Get the clock time until anything is next due to be called.
+
+        Return 0 if there are callbacks or tasks that run every tick, or None
+        if nothing is scheduled at all.
+
+        """
+        if self._each_tick or self._polling:
+            return 0
+        times = []
+        if self.events:
+            times.append(self.events[0].time)
+        if self._tasks:
+            times.append(self._tasks[0][0])
+        if not times:
+            return None
+        return max(min(times) - self.t, 0)
+
     def each_tick(self, callback):
         """Schedule a callback to be called every tick.
 
@@ -131,6 +206,95 @@ class Clock:
         """
         self._each_tick.append(mkref(callback))
 
+    def start_task(self, gen):
+        """Start a generator-based task, running it to its first yield.
+
+        Suspended tasks are resumed from tick() without allocating an Event
+        per step, so long scripted sequences have a constant scheduling cost.
+
+        :param gen: A generator that yields wait() or until() objects.
+        :returns: The Task, which may be cancelled with ``task.cancel()``.
+
+        """
+        task = Task(gen)
+        self._step(task)
+        return task
+
+    async def sleep(self, delay):
+        """Suspend an asyncio coroutine for `delay` seconds of clock time.
+
+        This keeps coroutines on the same timeline as scheduled callbacks and
+        tasks. The clock must be ticked from the asyncio loop, as by
+        PGZeroGame.run_async().
+
+        """
+        future = asyncio.get_running_loop().create_future()
+
+        def wake():
+            yield Wait(delay)
+            if not future.done():
+                future.set_result(None)
+
+        self.start_task(wake())
+        await future
+
+    def _step(self, task, value=None):
+        """Resume task with value and suspend it on whatever it yields."""
+        if not task.running:
+            return
+        self.fired = True
+        try:
+            cmd = task.gen.send(value)
+        except StopIteration:
+            task.running = False
+            return
+        except Exception:
+            import traceback
+            traceback.print_exc()
+            task.running = False
+            return
+
+        if isinstance(cmd, Until):
+            task.condition = cmd.condition
+            task.deadline = None
+            if cmd.timeout is not None:
+                task.deadline = self.t + cmd.timeout
+            self._polling.append(task)
+        else:
+            delay = 0 if cmd is None else cmd.delay
+            heapq.heappush(
+                self._tasks, (self.t + delay, next(self._task_seq), task)
+            )
+
+    def _fire_tasks(self):
+        # Collect due tasks first, so that a task yielding wait(0) resumes on
+        # the next tick rather than spinning within this one.
+        due = []
+        while self._tasks and self._tasks[0][0] <= self.t:
+            due.append(heapq.heappop(self._tasks)[2])
+        for task in due:
+            self._step(task)
+
+        if not self._polling:
+            return
+        polling = self._polling
+        self._polling = []
+        for task in polling:
+            if not task.running:
+                continue
+            try:
+                met = bool(task.condition())
+            except Exception:
+                import traceback
+                traceback.print_exc()
+                task.running = False
+                continue
+            if met or (task.deadline is not None and task.deadline <= self.t):
+                task.condition = task.deadline = None
+                self._step(task, met)
+            else:
+                self._polling.append(task)
+
     def _fire_each_tick(self, dt):
         dead = [None]
         for r in self._each_tick:
@@ -171,6 +335,8 @@ class Clock:
                 traceback.print_exc()
                 self.unschedule(cb)
 
+        self._fire_tasks()
+
 
 # One instance of a clock is available by default, to simplify the API
 clock = Clock()
@@ -180,3 +346,5 @@ schedule_interval = clock.schedule_interval
 schedule_unique = clock.schedule_unique
 unschedule = clock.unschedule
 each_tick = clock.each_tick
+start_task = clock.start_task
+sleep = clock.sleep
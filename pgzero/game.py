@@ -1,8 +1,11 @@
 import sys
+import asyncio
 import operator
 import time
+from types import ModuleType
 
 import pygame
+import pgzero.animation
 import pgzero.clock
 import pgzero.keyboard
 import pgzero.screen
@@ -13,6 +16,34 @@ from . import constants
 screen = None
 DISPLAY_FLAGS = 0
 
+# The longest time in seconds to block waiting for events when idle
+MAX_IDLE_WAIT = 1.0
+
+# How often to check for events when we can't block waiting for them
+IDLE_POLL_MS = 10
+
+# The most fixed-timestep updates to run per frame before dropping time
+MAX_UPDATE_STEPS = 5
+
+# Events telling us that the window needs repainting; Pygame 2 sends
+# WINDOWEXPOSED, and Pygame 1.x VIDEOEXPOSE
+EXPOSE_EVENTS = frozenset(
+    t for t in (pygame.VIDEOEXPOSE, getattr(pygame, 'WINDOWEXPOSED', None))
+    if t is not None
+)
+
+# Module constants that configure the window
+WINDOW_CONSTS = frozenset(('WIDTH', 'HEIGHT', 'TITLE', 'ICON'))
+
+# The game that is running
+_game = None
+
+# The window size asked for by resize_window() before the game was created
+_pending_size = None
+
+# The event types that Pygame has names for; see named_event_types()
+_event_types = None
+
 
 def exit():
     """Wait for up to a second for all sounds to play out
@@ -26,6 +57,56 @@ def exit():
     sys.exit()
 
 
+def resize_window(width, height):
+    """Resize the game window.
+
+    This sets WIDTH and HEIGHT in the game module; the window is resized
+    before the next frame is drawn. If this is called while the game module
+    is being loaded, the size is applied when the game is created.
+
+    """
+    global _pending_size
+    if _game is None:
+        _pending_size = width, height
+        return
+    _game.mod.WIDTH = width
+    _game.mod.HEIGHT = height
+
+
+class GameModule(ModuleType):
+    """The type of a game module.
+
+    Assigning any of WINDOW_CONSTS as an attribute of the module marks the
+    window configuration as changed, so that the game doesn't have to look
+    for changes every frame.
+
+    Rebinding these names with a ``global`` statement in the module's own
+    functions writes to its namespace directly and is not noticed; use
+    resize_window() (or assign the module attribute) instead.
+
+    """
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in WINDOW_CONSTS:
+            self.__dict__['__window_changed__'] = True
+
+
+def named_event_types():
+    """Get the event types that Pygame has names for.
+
+    Only these are safe to block: Pygame 2 maps some other type numbers onto
+    the same SDL events as the named ones.
+
+    """
+    global _event_types
+    if _event_types is None:
+        _event_types = [
+            t for t in range(pygame.NOEVENT + 1, pygame.USEREVENT)
+            if pygame.event.event_name(t) not in ('Unknown', 'UserEvent')
+        ]
+    return _event_types
+
+
 def positional_parameters(handler):
     """Get the positional parameters of the given function."""
     code = handler.__code__
@@ -34,6 +115,13 @@ def positional_parameters(handler):
 
 class PGZeroGame:
     def __init__(self, mod):
+        global _game, _pending_size
+        if not isinstance(mod, GameModule):
+            mod.__class__ = GameModule
+        if _pending_size:
+            mod.WIDTH, mod.HEIGHT = _pending_size
+            _pending_size = None
+        mod.__dict__['__window_changed__'] = True
         self.mod = mod
         self.screen = None
         self.width = None
@@ -42,19 +130,25 @@ class PGZeroGame:
         self.icon = None
         self.keyboard = pgzero.keyboard.keyboard
         self.handlers = {}
+        _game = self
 
     def reinit_screen(self):
+        """Apply any changes to the window configuration constants."""
         global screen
         mod = self.mod
+        if not mod.__window_changed__:
+            return
+        mod.__dict__['__window_changed__'] = False
         w = getattr(mod, 'WIDTH', 800)
         h = getattr(mod, 'HEIGHT', 600)
         if w != self.width or h != self.height:
             self.screen = pygame.display.set_mode((w, h), DISPLAY_FLAGS)
             if hasattr(self.mod, 'screen'):
                 self.mod.screen.surface = self.screen
+                self.mod.screen.width, self.mod.screen.height = w, h
             else:
                 self.mod.screen = pgzero.screen.Screen(self.screen)
-            screen = self.screen     # KILL ME
+            screen = self.mod.screen
             self.width = w
             self.height = h
 
@@ -94,6 +188,45 @@ class PGZeroGame:
             handler = getattr(self.mod, name, None)
             if callable(handler):
                 self.handlers[type] = self.prepare_handler(handler)
+        self.filter_events()
+
+    def filter_events(self):
+        """Have Pygame queue only the events that we will use.
+
+        These are the events that have handlers, plus those the game loop
+        needs itself. Only the other types are blocked, since blocking a type
+        discards those events already queued.
+
+        """
+        allowed = {pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP}
+        allowed.update(EXPOSE_EVENTS)
+        allowed.update(self.handlers)
+        pygame.event.set_blocked(
+            [t for t in named_event_types() if t not in allowed]
+        )
+        pygame.event.set_allowed(sorted(allowed))
+
+    @staticmethod
+    def coalesce_motion(events):
+        """Merge each run of consecutive MOUSEMOTION events into one.
+
+        The merged event has the position and buttons of the last event in
+        the run and the sum of their relative motions.
+
+        """
+        coalesced = []
+        for event in events:
+            if event.type == pygame.MOUSEMOTION and coalesced \
+                    and coalesced[-1].type == pygame.MOUSEMOTION:
+                rx, ry = coalesced[-1].rel
+                dx, dy = event.rel
+                coalesced[-1] = pygame.event.Event(
+                    pygame.MOUSEMOTION,
+                    dict(event.dict, rel=(rx + dx, ry + dy))
+                )
+            else:
+                coalesced.append(event)
+        return coalesced
 
     def prepare_handler(self, handler):
         """Adapt a pgzero game's raw handler function to take a Pygame Event.
@@ -108,44 +241,63 @@ class PGZeroGame:
         which means (among other things) that it will print as a symbolic value
         rather than a naive integer.
 
+        The adapter is built once per handler: arguments are fetched with a
+        single attrgetter and passed positionally.
+
         """
         code = handler.__code__
         param_names = code.co_varnames[:code.co_argcount]
-
-        def make_getter(mapper, getter):
-            if mapper:
-                return lambda event: mapper(getter(event))
-            return getter
-
-        param_handlers = []
-        for name in param_names:
-            getter = operator.attrgetter(name)
-            mapper = self.EVENT_PARAM_MAPPERS.get(name)
-            param_handlers.append((name, make_getter(mapper, getter)))
-
-        def prep_args(event):
-            return {name: get(event) for name, get in param_handlers}
+        if not param_names:
+            return lambda event: handler()
+
+        getter = operator.attrgetter(*param_names)
+        mappers = [
+            (i, self.EVENT_PARAM_MAPPERS[name])
+            for i, name in enumerate(param_names)
+            if name in self.EVENT_PARAM_MAPPERS
+        ]
+
+        if len(param_names) == 1:
+            if not mappers:
+                return lambda event: handler(getter(event))
+            mapper = mappers[0][1]
+
+            def get_args(event):
+                return [mapper(getter(event))]
+        elif mappers:
+            def get_args(event):
+                args = list(getter(event))
+                for i, mapper in mappers:
+                    args[i] = mapper(args[i])
+                return args
+        else:
+            return lambda event: handler(*getter(event))
 
         def new_handler(event):
             try:
-                prepped = prep_args(event)
+                args = get_args(event)
             except ValueError:
                 # If we couldn't construct the keys/mouse objects representing
                 # the button that was pressed, then skip the event handler.
                 #
                 # This happens because Pygame can generate key codes that it
                 # does not have constants for.
-                return
+                return False
             else:
-                return handler(**prepped)
+                return handler(*args)
 
         return new_handler
 
     def dispatch_event(self, event):
+        """Call the handler for event, if there is one.
+
+        As with update(), a handler may return False to report that it
+        changed nothing that needs redrawing.
+
+        """
         handler = self.handlers.get(event.type)
-        if handler:
+        if handler and handler(event) is not False:
             self.need_redraw = True
-            handler(event)
 
     def get_update_func(self):
         """Get a one-argument update function.
@@ -158,7 +310,13 @@ class PGZeroGame:
 
             update()
 
-        then this will be called. Otherwise return a no-op function.
+        then this will be called. Otherwise return None.
+
+        If update() returns False, it is reporting that nothing changed, so
+        the frame does not need to be redrawn.
+
+        If the module sets UPDATE_RATE, update() is called that many times per
+        second of game time with a fixed dt, however fast frames are drawn.
 
         """
         try:
@@ -187,39 +345,174 @@ class PGZeroGame:
                 )
             return draw
 
-    def run(self):
-        clock = pygame.time.Clock()
+    def idle_timeout(self):
+        """Get how long in seconds we can wait for events while idle."""
+        delay = pgzero.clock.clock.next_event_delay()
+        if delay is None or delay > MAX_IDLE_WAIT:
+            delay = MAX_IDLE_WAIT
+        return delay
+
+    def wait_for_events(self):
+        """Block until an event arrives or the clock has work to do.
+
+        Return a list of the events received, if any.
+
+        """
+        ms = int(self.idle_timeout() * 1000)
+        if ms <= 0:
+            return []
+        try:
+            event = pygame.event.wait(ms)
+        except TypeError:
+            # Pygame 1.x cannot wait with a timeout; poll the queue instead.
+            events = []
+            while ms > 0 and not events:
+                pygame.time.wait(IDLE_POLL_MS)
+                ms -= IDLE_POLL_MS
+                events = pygame.event.get()
+            return events
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event]
+
+    async def wait_for_events_async(self):
+        """Like wait_for_events(), but without blocking the asyncio loop."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.idle_timeout()
+        events = []
+        while not events:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(remaining, IDLE_POLL_MS / 1000.0))
+            events = pygame.event.get()
+        return events
+
+    def start(self):
+        """Prepare to run the game loop."""
         self.reinit_screen()
 
-        update = self.get_update_func()
-        draw = self.get_draw_func()
+        self.update = self.get_update_func()
+        self.draw = self.get_draw_func()
         self.load_handlers()
 
-        pgzclock = pgzero.clock.clock
+        self.fps = getattr(self.mod, 'FPS', 60) or 0
+        update_rate = getattr(self.mod, 'UPDATE_RATE', None)
+        self.step = update_rate and 1.0 / update_rate
+        self.accumulator = 0.0
+        # Whether the last fixed-timestep update that ran changed anything
+        self.step_changed = True
 
         self.need_redraw = True
+        self.idle = False
+
+    def frame(self, dt, events):
+        """Run one frame of the game loop.
+
+        Return False if the game should stop.
+
+        """
+        pgzclock = pgzero.clock.clock
+        update = self.update
+        step = self.step
+
+        if pygame.MOUSEMOTION in self.handlers:
+            events = self.coalesce_motion(events)
+        for event in events:
+            if event.type == pygame.QUIT:
+                return False
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_q and \
+                        event.mod & (pygame.KMOD_CTRL | pygame.KMOD_META):
+                    sys.exit(0)
+                self.keyboard._press(event.key)
+            elif event.type == pygame.KEYUP:
+                self.keyboard._release(event.key)
+            elif event.type in EXPOSE_EVENTS:
+                # Only the drawn areas are normally sent to the display, but
+                # the whole window needs repainting.
+                self.need_redraw = True
+                self.mod.screen._dirty_all = True
+            self.dispatch_event(event)
+        if not (update and step):
+            self.keyboard._snapshot()
+
+        pgzclock.tick(dt)
+
+        changed = busy = False
+        if update and step:
+            # Nothing was simulated while we slept, so don't catch up on it
+            if self.idle:
+                self.accumulator = min(dt, step)
+            else:
+                self.accumulator += dt
+            steps = 0
+            while self.accumulator >= step and steps < MAX_UPDATE_STEPS:
+                # Key edges are reported to the first step after them; they
+                # are kept over frames that run no step.
+                self.keyboard._snapshot()
+                self.step_changed = update(step) is not False
+                changed |= self.step_changed
+                self.accumulator -= step
+                steps += 1
+            if steps == MAX_UPDATE_STEPS:
+                # We're too slow to keep up; drop the backlog.
+                self.accumulator = min(self.accumulator, step)
+            # A frame too short for a step says nothing about whether the
+            # game is at rest; only an update that ran can say so.
+            busy = steps == 0 or self.step_changed
+        elif update:
+            changed = busy = update(dt) is not False
+
+        if changed or pgzclock.fired or self.need_redraw:
+            self.reinit_screen()
+            self.draw()
+            self.mod.screen._update_display()
+            self.need_redraw = False
+
+        # If nothing happened this frame, nothing will happen until an event
+        # arrives or a clock callback is due, so we can sleep until then.
+        self.idle = not (
+            events or busy or pgzclock.fired or
+            pgzero.animation.Animation.animations
+        )
+        return True
+
+    def run(self):
+        clock = pygame.time.Clock()
+        self.start()
+        pending = []
+        while True:
+            if self.idle:
+                pending = self.wait_for_events()
+            dt = clock.tick(self.fps) / 1000.0
+            if not self.frame(dt, pending + pygame.event.get()):
+                return
+            pending = []
+
+    async def run_async(self):
+        """Run the game loop as an asyncio task.
+
+        Frames are paced with asyncio.sleep() rather than by blocking, so
+        other coroutines - such as ones awaiting I/O in executor threads - run
+        between frames. Coroutines can wait on the game's clock with
+        ``await clock.sleep(delay)``.
+
+        """
+        loop = asyncio.get_running_loop()
+        self.start()
+        last = loop.time()
+        pending = []
         while True:
-            dt = clock.tick(60) / 1000.0
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_q and \
-                            event.mod & (pygame.KMOD_CTRL | pygame.KMOD_META):
-                        sys.exit(0)
-                    self.keyboard._press(event.key)
-                elif event.type == pygame.KEYUP:
-                    self.keyboard._release(event.key)
-                self.dispatch_event(event)
-
-            pgzclock.tick(dt)
-
-            if update:
-                update(dt)
-
-            if update or pgzclock.fired or self.need_redraw:
-                self.reinit_screen()
-                draw()
-                pygame.display.flip()
-                self.need_redraw = False
+            if self.idle:
+                pending = await self.wait_for_events_async()
+            # Always yield to the loop at least once per frame
+            delay = 0
+            if self.fps:
+                delay = max(last + 1.0 / self.fps - loop.time(), 0)
+            await asyncio.sleep(delay)
+            now = loop.time()
+            dt, last = now - last, now
+            if not self.frame(dt, pending + pygame.event.get()):
+                return
+            pending = []
@@ -6,6 +6,14 @@ from .constants import keys
 DEPRECATED_KEY_RE = re.compile(r'[A-Z]')
 PREFIX_RE = re.compile(r'^K_(?!\d$)')
 
+# The index of each key's state in Keyboard._state, by key code
+KEY_INDEX = {k.value: i for i, k in enumerate(keys)}
+
+
+def _key_property(index):
+    """Make a property that reads the state of the key at index."""
+    return property(lambda self: self._state[index] != 0)
+
 
 class Keyboard:
     """The current state of the keyboard.
@@ -16,13 +24,25 @@ class Keyboard:
 
     is True if the 'A' key is depressed, and False otherwise.
 
+    A key name is resolved the first time it is used, and from then on is a
+    property reading a compact array of key states.
+
     """
-    # The current key state. This may as well be a class attribute - there's
-    # only one keyboard.
-    _pressed = set()
+    def __init__(self):
+        # The current key state, as a byte per key in KEY_INDEX order
+        self._state = bytearray(len(KEY_INDEX))
+
+        # Key codes pressed/released since the last snapshot
+        self._down = set()
+        self._up = set()
+
+        # Key codes pressed/released between the last two snapshots
+        self._pressed_frame = frozenset()
+        self._released_frame = frozenset()
 
     def __getattr__(self, kname):
-        if DEPRECATED_KEY_RE.match(kname):
+        deprecated = DEPRECATED_KEY_RE.match(kname)
+        if deprecated:
             warn(
                 "Uppercase keyboard attributes (eg. keyboard.%s) are "
                 "deprecated." % kname,
@@ -32,21 +52,53 @@ class Keyboard:
             kname = PREFIX_RE.sub('', kname)
         try:
             key = keys[kname.upper()]
-        except AttributeError:
-            raise AttributeError('The key "%s" does not exist' % key)
-        return key.value in self._pressed
+        except KeyError:
+            raise AttributeError('The key "%s" does not exist' % kname)
+        index = KEY_INDEX[key.value]
+        if not deprecated:
+            # Cache the lookup; future accesses won't reach __getattr__
+            setattr(type(self), kname, _key_property(index))
+        return self._state[index] != 0
 
     def _press(self, key):
         """Called by Game to mark the key as pressed."""
-        self._pressed.add(key)
+        index = KEY_INDEX.get(key)
+        if index is not None:
+            self._state[index] = 1
+        self._down.add(key)
 
     def _release(self, key):
         """Called by Game to mark the key as released."""
-        self._pressed.discard(key)
+        index = KEY_INDEX.get(key)
+        if index is not None:
+            self._state[index] = 0
+        self._up.add(key)
+
+    def _snapshot(self):
+        """Called by Game before each update.
+
+        This fixes the keys reported by pressed_this_frame() and
+        released_this_frame() until the next update. With a fixed
+        UPDATE_RATE that is before each update step, so a key press is seen
+        by exactly one step, however many steps a frame runs.
+
+        """
+        self._pressed_frame = frozenset(self._down)
+        self._released_frame = frozenset(self._up)
+        self._down.clear()
+        self._up.clear()
+
+    def pressed_this_frame(self, key):
+        """Return True if the given key was pressed since the last update."""
+        return key in self._pressed_frame
+
+    def released_this_frame(self, key):
+        """Return True if the given key was released since the last update."""
+        return key in self._released_frame
 
     def __getitem__(self, k):
         if isinstance(k, keys):
-            return k.value in self._pressed
+            return self._state[KEY_INDEX[k.value]] != 0
         else:
             warn(
                 "String lookup in keyboard (eg. keyboard[%r]) is "
@@ -1,4 +1,5 @@
 import os.path
+import weakref
 from types import ModuleType
 import pygame.image
 import pygame.mixer
@@ -113,6 +114,11 @@ class ResourceLoader:
         if key in self.cache:
             return self.cache[key]
 
+        res = self.cache[key] = self._load(self._find(name), *args, **kwargs)
+        return res
+
+    def _find(self, name):
+        """Return the path of the named resource."""
         if not self.have_root:
             self.validate_root(name)
         p = os.path.join(self._root(), name)
@@ -132,8 +138,7 @@ class ResourceLoader:
                 )
 
         validate_compatible_path(p)
-        res = self.cache[key] = self._load(p, *args, **kwargs)
-        return res
+        return p
 
     def __getattr__(self, name):
         p = os.path.join(self._root(), name)
@@ -153,8 +158,17 @@ class ImageLoader(ResourceLoader):
     EXTNS = ['png', 'gif', 'jpg', 'jpeg', 'bmp']
     TYPE = 'image'
 
+    # Every image loaded, by any loader; these are not expected to change
+    _loaded = weakref.WeakSet()
+
     def _load(self, path):
-        return pygame.image.load(path).convert_alpha()
+        image = pygame.image.load(path).convert_alpha()
+        self._loaded.add(image)
+        return image
+
+    def is_loaded(self, image):
+        """Return True if image is a Surface that was loaded by a loader."""
+        return image in self._loaded
 
 
 class UnsupportedFormat(Exception):
@@ -208,12 +222,12 @@ def getfont(fontname, fontsize):
     fontsize = fontsize or ptext.DEFAULT_FONT_SIZE
 
     if fontname is None:
-        key = fontname, fontsize
-        f = ptext._font_cache.get(key)
+        key = 'font', fontname, fontsize
+        f = ptext._cache.get(key)
         if f:
             return f
         f = pygame.font.Font(fontname, fontsize)
-        ptext._font_cache[key] = f
+        ptext._cache.put(key, f, ptext.FONT_MEMORY_ESTIMATE)
     else:
         f = fonts.load(fontname, fontsize)
     return f
@@ -239,6 +253,7 @@ def getfont(
     if fontsize is None:
         fontsize = DEFAULT_FONT_SIZE
     key = (
+        'font',
         fontname,
         fontsize,
         sysfontname,
@@ -246,8 +261,9 @@ def getfont(
         italic,
         underline
     )
-    if key in ptext._font_cache:
-        return ptext._font_cache[key]
+    font = ptext._cache.get(key)
+    if font is not None:
+        return font
     if sysfontname is not None:
         font = pygame.font.SysFont(
             sysfontname,
@@ -256,14 +272,16 @@ def getfont(
             bool(italic)
         )
     else:
-        font = fonts.load(fontname, fontsize)
+        # Not fonts.load(), whose cache would keep every size ever used;
+        # ptext's cache keeps only those used recently.
+        font = fonts._load(fonts._find(fontname), fontsize)
     if bold is not None:
         font.set_bold(bold)
     if italic is not None:
         font.set_italic(italic)
     if underline is not None:
         font.set_underline(underline)
-    ptext._font_cache[key] = font
+    ptext._cache.put(key, font, ptext.FONT_MEMORY_ESTIMATE)
     return font
 
 ptext.getfont = getfont
@@ -17,9 +17,15 @@ and used under CC0.
 
 from __future__ import division
 
+from collections import OrderedDict
 from math import ceil, sin, cos, radians
 import pygame
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 DEFAULT_FONT_SIZE = 24
 REFERENCE_FONT_SIZE = 100
 DEFAULT_LINE_HEIGHT = 1.0
@@ -29,6 +35,7 @@ DEFAULT_COLOR = "white"
 DEFAULT_BACKGROUND = None
 DEFAULT_OUTLINE_COLOR = "black"
 DEFAULT_SHADOW_COLOR = "black"
+MASK_COLOR = 255, 255, 255, 255  # colour of text that is tinted to other colours
 OUTLINE_UNIT = 1 / 24
 SHADOW_UNIT = 1 / 18
 DEFAULT_ALIGN = "left"  # left, center, or right
@@ -38,12 +45,83 @@ ALPHA_RESOLUTION = 16
 ANGLE_RESOLUTION_DEGREES = 3
 
 AUTO_CLEAN = True
+GLYPH_ATLAS = False  # compose plain text from per-glyph atlases
+LINE_CACHE = False  # cache each rendered line, and compose text from the lines
 MEMORY_LIMIT_MB = 64
-MEMORY_REDUCTION_FACTOR = 0.5
+FONT_MEMORY_ESTIMATE = 1 << 16  # bytes charged to the cache for each font
+ENTRY_MEMORY_ESTIMATE = 1 << 8  # bytes charged for each small cached value
+WRAP_JOIN_ERROR = 0.25  # most a joined width can be out, in font heights
 
 pygame.font.init()
 
-_font_cache = {}
+
+class CacheManager:
+    """A least recently used cache of everything ptext keeps for reuse.
+
+    Each entry is charged a number of bytes, and clean() evicts the least
+    recently used entries until the total is within MEMORY_LIMIT_MB.
+
+    """
+    def __init__(self):
+        # key: (value, bytes), least recently used first
+        self._entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        """Return the value for key, marking it as recently used."""
+        try:
+            value, size = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value, size):
+        """Store value for key, charging it size bytes."""
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes -= old[1]
+        self._entries[key] = value, size
+        self.bytes += size
+
+    def evict(self, limit):
+        """Drop the least recently used entries until within limit bytes."""
+        entries = self._entries
+        while self.bytes > limit and entries:
+            key, (value, size) = entries.popitem(last=False)
+            self.bytes -= size
+            self.evictions += 1
+
+    def clear(self):
+        """Drop all entries."""
+        self._entries.clear()
+        self.bytes = 0
+
+    def stats(self):
+        """Return a dict of the cache's hits, misses, evictions and size."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'bytes': self.bytes,
+            'entries': len(self._entries),
+        }
+
+
+_cache = CacheManager()
+
+
+def cachestats():
+    """Return the hits, misses, evictions and size of ptext's cache."""
+    return _cache.stats()
 
 
 def getfont(fontname=None, fontsize=None, sysfontname=None,
@@ -54,9 +132,10 @@ def getfont(fontname=None, fontsize=None, sysfontname=None,
         fontname = DEFAULT_FONT_NAME
     if fontsize is None:
         fontsize = DEFAULT_FONT_SIZE
-    key = fontname, fontsize, sysfontname, bold, italic, underline
-    if key in _font_cache:
-        return _font_cache[key]
+    key = 'font', fontname, fontsize, sysfontname, bold, italic, underline
+    font = _cache.get(key)
+    if font is not None:
+        return font
     if sysfontname is not None:
         font = pygame.font.SysFont(
             sysfontname, fontsize, bold or False, italic or False)
@@ -73,7 +152,7 @@ def getfont(fontname=None, fontsize=None, sysfontname=None,
         font.set_italic(italic)
     if underline is not None:
         font.set_underline(underline)
-    _font_cache[key] = font
+    _cache.put(key, font, FONT_MEMORY_ESTIMATE)
     return font
 
 
@@ -91,13 +170,32 @@ def wrap(text, fontname=None, fontsize=None, sysfontname=None,
     if strip is None:
         strip = DEFAULT_STRIP
     texts = text.replace("\t", "    ").split("\n")
+    if width is None:
+        return [text.rstrip(" ") if strip else text for text in texts]
+
+    # Lines are measured by adding up the widths of their words, which are
+    # cached per font. Every measurement includes any overhang from italic or
+    # bold, which is taken off again at each join. What is left of the error
+    # is small, and lines that come out close to the limit are measured
+    # exactly.
+    key = 'widths', id(font)
+    entry = _cache.get(key)
+    if entry is None or entry[0] is not font:
+        overhang = font.size("n")[0] + font.size(" n")[0] - font.size("n n")[0]
+        entry = font, {}, overhang
+    font, widths, overhang = entry
+    joinerror = WRAP_JOIN_ERROR * font.get_height()
+
+    def measure(text):
+        w = widths.get(text)
+        if w is None:
+            w = widths[text] = font.size(text)[0]
+        return w
+
     lines = []
     for text in texts:
         if strip:
             text = text.rstrip(" ")
-        if width is None:
-            lines.append(text)
-            continue
         if not text:
             lines.append("")
             continue
@@ -106,72 +204,124 @@ def wrap(text, fontname=None, fontsize=None, sysfontname=None,
         # At any time, a is the rightmost known index you can legally split a line. I.e. it's legal
         # to add text[:a] to lines, and line is what will be added to lines if
         # text is split at a.
-        a = text.index(" ", a) if " " in text else len(text)
+        a = text.find(" ", a)
+        if a == -1:
+            a = len(text)
         line = text[:a]
+        # The width of line, and the number of joins since it was measured exactly.
+        linew = measure(line)
+        joins = 0
         while a + 1 < len(text):
             # b is the next legal place to break the line, with bline the
             # corresponding line to add.
-            if " " not in text[a + 1:]:
+            if text.find(" ", a + 1) == -1:
                 b = len(text)
-                bline = text
             elif strip:
                 # Lines may be split at any space character that immediately follows a non-space
                 # character.
                 b = text.index(" ", a + 1)
                 while text[b - 1] == " ":
-                    if " " in text[b + 1:]:
-                        b = text.index(" ", b + 1)
-                    else:
+                    b = text.find(" ", b + 1)
+                    if b == -1:
                         b = len(text)
                         break
-                bline = text[:b]
             else:
                 # Lines may be split at any space character, or any character immediately following
                 # a space character.
                 b = a + 1 if text[a] == " " else text.index(" ", a + 1)
             bline = text[:b]
-            if font.size(bline)[0] <= width:
-                a, line = b, bline
+            piece = text[a:b]
+            joins += 1
+            slack = joins * joinerror
+            # Trailing spaces can take up an italic overhang, so joins next to
+            # them are always measured exactly
+            if line.endswith(" ") or piece.endswith(" "):
+                w = None
+            else:
+                w = linew + measure(piece) - overhang
+            if w is not None and w <= width - slack:
+                fits = True
+            elif w is not None and w > width + slack:
+                fits = False
+            else:
+                w = font.size(bline)[0]
+                joins = 0
+                fits = w <= width
+            if fits:
+                a, line, linew = b, bline, w
             else:
                 lines.append(line)
                 text = text[a:].lstrip(" ") if strip else text[a:]
-                a = text.index(" ", 1) if " " in text[1:] else len(text)
+                a = text.find(" ", 1)
+                if a == -1:
+                    a = len(text)
                 line = text[:a]
+                linew = measure(line)
+                joins = 0
         if text:
             lines.append(line)
+    _cache.put(key, entry, ENTRY_MEMORY_ESTIMATE * (len(widths) + 1))
     return lines
 
-_fit_cache = {}
+
+def _bisect_fit(fits, a, b):
+    """Return the largest size from a to b that fits, or a if none do."""
+    if not fits(a):
+        return a
+    if fits(b):
+        return b
+    while b - a > 1:
+        c = (a + b) // 2
+        if fits(c):
+            a = c
+        else:
+            b = c
+    return a
 
 
 def _fitsize(text, fontname, sysfontname, bold, italic, underline, width, height, lineheight, strip):
-    key = text, fontname, sysfontname, bold, italic, underline, width, height, lineheight, strip
-    if key in _fit_cache:
-        return _fit_cache[key]
+    key = 'fit', text, fontname, sysfontname, bold, italic, underline, width, height, lineheight, strip
+    fontsize = _cache.get(key)
+    if fontsize is not None:
+        return fontsize
 
     def fits(fontsize):
         texts = wrap(text, fontname, fontsize, sysfontname,
-                     bold, italic, underline, width, strip)
+                     bold, italic, underline, width=width, strip=strip)
         font = getfont(fontname, fontsize, sysfontname,
                        bold, italic, underline)
         w = max(font.size(line)[0] for line in texts)
         linesize = font.get_linesize() * lineheight
         h = int(round((len(texts) - 1) * linesize)) + font.get_height()
         return w <= width and h <= height
-    a, b = 1, 256
-    if not fits(a):
-        fontsize = a
-    elif fits(b):
-        fontsize = b
+
+    # Estimate the size from measurements of the text at REFERENCE_FONT_SIZE,
+    # which scale roughly in proportion to the font size.
+    reffont = getfont(fontname, REFERENCE_FONT_SIZE, sysfontname,
+                      bold, italic, underline)
+
+    def estimate_fits(fontsize):
+        texts = wrap(text, fontname, None, sysfontname, bold, italic, underline,
+                     widthem=width / fontsize, strip=strip)
+        scale = fontsize / REFERENCE_FONT_SIZE
+        w = max(reffont.size(line)[0] for line in texts) * scale
+        linesize = reffont.get_linesize() * lineheight
+        h = ((len(texts) - 1) * linesize + reffont.get_height()) * scale
+        return w <= width and h <= height
+
+    # Then check it, and the size above it, at the real size. The estimate
+    # is rarely out by more than one.
+    tallest = REFERENCE_FONT_SIZE * height // reffont.get_height()
+    fontsize = _bisect_fit(estimate_fits, 1, int(min(max(tallest, 1), 256)))
+    if fits(fontsize):
+        while fontsize < 256 and fits(fontsize + 1):
+            fontsize += 1
     else:
-        while b - a > 1:
-            c = (a + b) // 2
-            if fits(c):
-                a = c
-            else:
-                b = c
-        fontsize = a
-    _fit_cache[key] = fontsize
+        while fontsize > 1:
+            fontsize -= 1
+            if fits(fontsize):
+                break
+    _cache.put(key, fontsize, ENTRY_MEMORY_ESTIMATE + len(text))
     return fontsize
 
 
@@ -223,18 +373,159 @@ def _circlepoints(r):
     points.sort()
     return points
 
-_surf_cache = {}
-_surf_tick_usage = {}
-_surf_size_total = 0
-_unrotated_size = {}
-_tick = 0
+class _GlyphAtlas:
+    """The glyphs of one font in one colour, each rendered once.
+
+    The glyphs are kept side by side in a single surface, and strings are
+    composed by copying glyphs out of it at their advances.
+
+    """
+    def __init__(self, key, font, antialias, color):
+        self.key = key
+        self.font = font
+        self.antialias = antialias
+        self.color = color
+        self.clear = color[:3] + (0,)
+        self.surf = self._newsurf(256, font.get_height())
+        self.x = 0
+        # character: (rect of the glyph in surf, advance)
+        self.glyphs = {}
+
+    def _newsurf(self, width, height):
+        surf = pygame.Surface((width, height), pygame.SRCALPHA)
+        surf.fill(self.clear)
+        return surf
+
+    def _add(self, ch):
+        # Without antialiasing the glyph is palettised with a colorkey, which
+        # blending would copy as opaque background
+        gsurf = self.font.render(ch, self.antialias, self.color)
+        gsurf = gsurf.convert_alpha()
+        w, h = gsurf.get_size()
+        width, height = self.surf.get_size()
+        # Glyphs can be taller than the font's height
+        if self.x + w > width or h > height:
+            if self.x + w > width:
+                width = max(2 * width, self.x + w)
+            surf = self._newsurf(width, max(height, h))
+            surf.blit(self.surf, (0, 0), None, pygame.BLEND_RGBA_MAX)
+            self.surf = surf
+            _cache.put(self.key, self, self.get_size())
+        self.surf.blit(gsurf, (self.x, 0), None, pygame.BLEND_RGBA_MAX)
+        metrics = self.font.metrics(ch)[0]
+        advance = metrics[4] if metrics else w
+        glyph = self.glyphs[ch] = pygame.Rect(self.x, 0, w, h), advance
+        self.x += w
+        return glyph
+
+    def render(self, text):
+        """Render text as font.render() would."""
+        if not text:
+            return self.font.render(text, self.antialias, self.color)
+        glyphs = self.glyphs
+        surf = pygame.Surface(self.font.size(text), pygame.SRCALPHA)
+        surf.fill(self.clear)
+        x = 0
+        for ch in text:
+            area, advance = glyphs.get(ch) or self._add(ch)
+            surf.blit(self.surf, (x, 0), area, pygame.BLEND_RGBA_MAX)
+            x += advance
+        return surf
+
+    def get_size(self):
+        """Return the number of bytes used by the atlas."""
+        w, h = self.surf.get_size()
+        return 4 * w * h
+
+
+def _multiply(surf, color):
+    """Return a copy of surf with every pixel multiplied by color."""
+    # Blitting a solid surface is much faster than filling with a blend flag.
+    solid = pygame.Surface(surf.get_size()).convert_alpha()
+    solid.fill(color)
+    surf = surf.copy()
+    surf.blit(solid, (0, 0), None, pygame.BLEND_RGBA_MULT)
+    return surf
 
 
-def getsurf(text, fontname=None, fontsize=None, sysfontname=None, bold=None, italic=None,
-            underline=None, width=None, widthem=None, strip=None, color=None,
-            background=None, antialias=True, ocolor=None, owidth=None, scolor=None, shadow=None,
-            gcolor=None, alpha=1.0, align=None, lineheight=None, angle=0, cache=True):
-    global _tick, _surf_size_total
+def _spread(coverage, r):
+    """Spread a 2D coverage array out by r pixels in every direction.
+
+    The result is copies of the coverage at each point of _circlepoints(r),
+    composited as blitting them would: alphas a and b give 1 - (1 - a)(1 - b).
+    This is done by adding logs of 1 - a. The sum over a horizontal run of
+    points is the difference of two prefix sums, so this takes O(r) array
+    operations rather than one per point.
+
+    """
+    w, h = coverage.shape
+    # Each column is padded with r zeros, so moving a whole array by up to r
+    # places moves the columns up or down without mixing them.
+    hp = h + r
+    logs = numpy.zeros((w, hp), numpy.float32)
+    # Full coverage is clamped to just under 1, so its log is finite
+    logs[:, :h] = numpy.log(numpy.maximum(
+        1 - coverage / numpy.float32(255), numpy.float32(1 / 1024)
+    ))
+    # sums[x] is the total of logs[x - r - 1] and every column left of it
+    sums = numpy.zeros((w + 2 * r + 1, hp), numpy.float32)
+    numpy.cumsum(logs, axis=0, out=sums[r + 1:r + 1 + w])
+    sums[r + 1 + w:] = sums[r + w]
+
+    # The runs of points in each row; the circle is symmetrical, so the rows
+    # above the middle are the same as those below
+    runs = [[] for dy in range(r + 1)]
+    for dx, dy in _circlepoints(r):
+        if dy >= 0:
+            row = runs[dy]
+            if row and row[-1][1] == dx - 1:
+                row[-1][1] = dx
+            else:
+                row.append([dx, dx])
+    out = numpy.zeros(w * hp, numpy.float32)
+    total = numpy.empty((w, hp), numpy.float32)
+    run = numpy.empty_like(total)
+    flat = total.ravel()
+    for dy, row in enumerate(runs):
+        for i, (a, b) in enumerate(row):
+            numpy.subtract(
+                sums[r + 1 - a:r + 1 - a + w], sums[r - b:r - b + w],
+                out=run if i else total
+            )
+            if i:
+                total += run
+        out[dy:] += flat[:len(out) - dy]
+        if dy:
+            out[:-dy] += flat[dy:]
+    # Rounding may leave sums slightly above zero, which would wrap around
+    out = numpy.minimum(out.reshape(w, hp)[:, :h], 0)
+    numpy.exp(out, out=out)
+    return numpy.rint(255 - 255 * out).astype(coverage.dtype)
+
+
+def getatlas(fontname=None, fontsize=None, sysfontname=None,
+             bold=None, italic=None, antialias=True, color=None):
+    """Get the glyph atlas for the given font and colour."""
+    color = _resolvecolor(color, DEFAULT_COLOR)
+    key = 'atlas', fontname, fontsize, sysfontname, bold, italic, antialias, color
+    atlas = _cache.get(key)
+    if atlas is None:
+        font = getfont(fontname, fontsize, sysfontname, bold, italic)
+        atlas = _GlyphAtlas(key, font, antialias, color)
+        _cache.put(key, atlas, atlas.get_size())
+    return atlas
+
+
+
+def _resolveoptions(fontname, fontsize, sysfontname, bold, italic, underline, width, widthem,
+                    strip, color, background, antialias, ocolor, owidth, scolor, shadow, gcolor,
+                    alpha, align, lineheight, angle):
+    """Apply defaults to getsurf()'s options, and put them in a standard form.
+
+    Return them as a tuple, with opx and spx in place of owidth and shadow,
+    that identifies the surface for any given text.
+
+    """
     if fontname is None:
         fontname = DEFAULT_FONT_NAME
     if fontsize is None:
@@ -259,14 +550,45 @@ def getsurf(text, fontname=None, fontsize=None, sysfontname=None, bold=None, ita
     alpha = _resolvealpha(alpha)
     angle = _resolveangle(angle)
     strip = DEFAULT_STRIP if strip is None else strip
-    key = (text, fontname, fontsize, sysfontname, bold, italic, underline, width, widthem, strip,
-           color, background, antialias, ocolor, opx, scolor, spx, gcolor, alpha, align, lineheight, angle)
-    if key in _surf_cache:
-        _surf_tick_usage[key] = _tick
-        _tick += 1
-        return _surf_cache[key]
+    return (fontname, fontsize, sysfontname, bold, italic, underline, width, widthem, strip,
+            color, background, antialias, ocolor, opx, scolor, spx, gcolor, alpha, align, lineheight, angle)
+
+
+def _getlines(texts, render, style):
+    """Return a surface for each line of text, rendering only new lines.
+
+    style identifies how render() draws a line, so that lines are shared by
+    all text drawn the same way, however it is wrapped.
+
+    """
+    lsurfs = []
+    for text in texts:
+        key = ('line', text) + style
+        lsurf = _cache.get(key)
+        if lsurf is None:
+            lsurf = render(text)
+            w, h = lsurf.get_size()
+            _cache.put(key, lsurf, 4 * w * h)
+        lsurfs.append(lsurf)
+    return lsurfs
+
+
+def getsurf(text, fontname=None, fontsize=None, sysfontname=None, bold=None, italic=None,
+            underline=None, width=None, widthem=None, strip=None, color=None,
+            background=None, antialias=True, ocolor=None, owidth=None, scolor=None, shadow=None,
+            gcolor=None, alpha=1.0, align=None, lineheight=None, angle=0, cache=True):
+    options = _resolveoptions(fontname, fontsize, sysfontname, bold, italic, underline, width,
+                              widthem, strip, color, background, antialias, ocolor, owidth,
+                              scolor, shadow, gcolor, alpha, align, lineheight, angle)
+    (fontname, fontsize, sysfontname, bold, italic, underline, width, widthem, strip,
+     color, background, antialias, ocolor, opx, scolor, spx, gcolor, alpha, align, lineheight, angle) = options
+    key = ('surf', text) + options
+    surf = _cache.get(key)
+    if surf is not None:
+        return surf
     texts = wrap(text, fontname, fontsize, sysfontname, bold, italic, underline,
                  width=width, widthem=widthem, strip=strip)
+    cachedline = None
     if angle:
         surf0 = getsurf(text, fontname, fontsize, sysfontname, bold, italic, underline,
                         width, widthem, strip, color, background, antialias,
@@ -275,16 +597,12 @@ def getsurf(text, fontname=None, fontsize=None, sysfontname=None, bold=None, ita
             surf = pygame.transform.rotate(surf0, angle)
         else:
             surf = pygame.transform.rotozoom(surf0, angle, 1.0)
-        _unrotated_size[(surf.get_size(), angle, text)] = surf0.get_size()
     elif alpha < 1.0:
         surf0 = getsurf(text, fontname, fontsize, sysfontname, bold, italic, underline,
                         width, widthem, strip, color, background, antialias,
                         ocolor, owidth, scolor, shadow, gcolor=gcolor, align=align,
                         lineheight=lineheight, cache=cache)
-        surf = surf0.copy()
-        array = pygame.surfarray.pixels_alpha(surf)
-        array[:, :] = (array[:, :] * alpha).astype(array.dtype)
-        del array
+        surf = _multiply(surf0, (255, 255, 255, int(alpha * 255)))
     elif spx is not None:
         surf0 = getsurf(text, fontname, fontsize, sysfontname, bold, italic, underline,
                         width, widthem, strip, color=color, background=(0, 0, 0, 0), antialias=antialias,
@@ -311,14 +629,28 @@ def getsurf(text, fontname=None, fontsize=None, sysfontname=None, bold=None, ita
         surf0 = getsurf(text, fontname, fontsize, sysfontname, bold, italic, underline,
                         width, widthem, strip, color=color, background=(0, 0, 0, 0), antialias=antialias,
                         gcolor=gcolor, align=align, lineheight=lineheight, cache=cache)
-        osurf = getsurf(text, fontname, fontsize, sysfontname, bold, italic, underline,
-                        width, widthem, strip, color=ocolor, background=(0, 0, 0, 0), antialias=antialias,
-                        align=align, lineheight=lineheight, cache=cache)
         w0, h0 = surf0.get_size()
         surf = pygame.Surface((w0 + 2 * opx, h0 + 2 * opx)).convert_alpha()
-        surf.fill(background or (0, 0, 0, 0))
-        for dx, dy in _circlepoints(opx):
-            surf.blit(osurf, (dx + opx, dy + opx))
+        if numpy is not None:
+            # The outline is the text's coverage spread out by opx pixels.
+            coverage = numpy.zeros(surf.get_size(), numpy.uint8)
+            coverage[opx:opx + w0, opx:opx + h0] = pygame.surfarray.array_alpha(surf0)
+            surf.fill(ocolor[:3] + (0,))
+            array = pygame.surfarray.pixels_alpha(surf)
+            array[:, :] = _spread(coverage, opx)
+            del array
+            if background is not None and background[3:] != (0,):
+                outline = surf
+                surf = pygame.Surface(surf.get_size()).convert_alpha()
+                surf.fill(background)
+                surf.blit(outline, (0, 0))
+        else:
+            osurf = getsurf(text, fontname, fontsize, sysfontname, bold, italic, underline,
+                            width, widthem, strip, color=ocolor, background=(0, 0, 0, 0), antialias=antialias,
+                            align=align, lineheight=lineheight, cache=cache)
+            surf.fill(background or (0, 0, 0, 0))
+            for dx, dy in _circlepoints(opx):
+                surf.blit(osurf, (dx + opx, dy + opx))
         if len(color) > 3 and color[3] == 0:
             array = pygame.surfarray.pixels_alpha(surf)
             array0 = pygame.surfarray.pixels_alpha(surf0)
@@ -327,29 +659,65 @@ def getsurf(text, fontname=None, fontsize=None, sysfontname=None, bold=None, ita
             del array, array0
         else:
             surf.blit(surf0, (opx, opx))
+    elif gcolor is not None:
+        # A gradient is the text in white, multiplied by a strip running from
+        # color at the middle of each line to gcolor at its baseline.
+        font = getfont(fontname, fontsize, sysfontname,
+                       bold, italic, underline)
+        mask = getsurf(text, fontname, fontsize, sysfontname, bold, italic, underline,
+                       width, widthem, strip, MASK_COLOR, (0, 0, 0, 0), antialias,
+                       align=align, lineheight=lineheight, cache=cache and not LINE_CACHE)
+        w, h = mask.get_size()
+        lineh = font.get_height()
+        ramp = pygame.Surface((1, lineh)).convert_alpha()
+        for y in range(lineh):
+            m = min(max(y * 2.0 / font.get_ascent() - 1.0, 0), 1)
+            ramp.set_at((0, y), tuple(
+                int((1.0 - m) * c + m * g) for c, g in zip(color[:3], gcolor[:3])
+            ))
+        ramp = pygame.transform.scale(ramp, (w, lineh))
+        surf = mask.copy()
+        linesize = font.get_linesize() * lineheight
+        ys = [int(round(k * linesize)) for k in range(len(texts))] + [h]
+        for y0, y1 in zip(ys, ys[1:]):
+            area = pygame.Rect(0, 0, w, min(lineh, y1 - y0))
+            surf.blit(ramp, (0, y0), area, pygame.BLEND_RGBA_MULT)
+        if background is not None and background[3:] != (0,):
+            text_surf = surf
+            surf = pygame.Surface((w, h)).convert_alpha()
+            surf.fill(background)
+            surf.blit(text_surf, (0, 0))
+    elif (color != MASK_COLOR and color[3:] in ((), (255,)) and
+            (background is None or (len(background) > 3 and background[3] == 0))):
+        # Plain text in any colour is a tinted copy of the same text in white,
+        # so changing its colour doesn't need it to be rendered again.
+        mask = getsurf(text, fontname, fontsize, sysfontname, bold, italic, underline,
+                       width, widthem, strip, MASK_COLOR, background, antialias,
+                       align=align, lineheight=lineheight, cache=cache and not LINE_CACHE)
+        surf = _multiply(mask, color)
     else:
         font = getfont(fontname, fontsize, sysfontname,
                        bold, italic, underline)
         # pygame.Font.render does not allow passing None as an argument value
         # for background.
-        if background is None or (len(background) > 3 and background[3] == 0) or gcolor is not None:
-            lsurfs = [font.render(text, antialias, color).convert_alpha()
-                      for text in texts]
+        if GLYPH_ATLAS and not underline and (
+                background is None or (len(background) > 3 and background[3] == 0)):
+            atlas = getatlas(fontname, fontsize, sysfontname,
+                             bold, italic, antialias, color)
+            render = atlas.render
+        elif background is None or (len(background) > 3 and background[3] == 0):
+            def render(text):
+                return font.render(text, antialias, color).convert_alpha()
+        else:
+            def render(text):
+                return font.render(text, antialias, color, background).convert_alpha()
+        if LINE_CACHE:
+            lsurfs = _getlines(texts, render, (fontname, fontsize, sysfontname, bold, italic,
+                                               underline, color, background, antialias))
+            cachedline = lsurfs[0]
         else:
-            lsurfs = [font.render(text, antialias, color,
-                                  background).convert_alpha() for text in texts]
-        if gcolor is not None:
-            import numpy
-            m = numpy.clip(numpy.arange(
-                lsurfs[0].get_height()) * 2.0 / font.get_ascent() - 1.0, 0, 1)
-            for lsurf in lsurfs:
-                array = pygame.surfarray.pixels3d(lsurf)
-                for j in (0, 1, 2):
-                    array[:, :, j] = (
-                        (1.0 - m) * array[:, :, j] + m * gcolor[j]).astype(array.dtype)
-                del array
-
-        if len(lsurfs) == 1 and gcolor is None:
+            lsurfs = [render(text) for text in texts]
+        if len(lsurfs) == 1:
             surf = lsurfs[0]
         else:
             w = max(lsurf.get_width() for lsurf in lsurfs)
@@ -363,34 +731,21 @@ def getsurf(text, fontname=None, fontsize=None, sysfontname=None, bold=None, ita
                 surf.blit(lsurf, (x, y))
     if cache:
         w, h = surf.get_size()
-        _surf_size_total += 4 * w * h
-        _surf_cache[key] = surf
-        _surf_tick_usage[key] = _tick
-        _tick += 1
+        if surf is cachedline:
+            # Already paid for by the line cache
+            _cache.put(key, surf, ENTRY_MEMORY_ESTIMATE)
+        else:
+            _cache.put(key, surf, 4 * w * h)
     return surf
 
-_default_surf_sentinel = ()
 
+def _resolvepos(pos, anchor, top, left, bottom, right, topleft, bottomleft, topright,
+                bottomright, midtop, midleft, midbottom, midright, center, centerx, centery):
+    """Work out draw()'s position and anchor from its positional options.
 
-def draw(text, pos=None,
-         fontname=None, fontsize=None, sysfontname=None,
-         antialias=True, bold=None, italic=None, underline=None,
-         color=None, background=None,
-         top=None, left=None, bottom=None, right=None,
-         topleft=None, bottomleft=None, topright=None, bottomright=None,
-         midtop=None, midleft=None, midbottom=None, midright=None,
-         center=None, centerx=None, centery=None,
-         width=None,	widthem=None, lineheight=None, strip=None,
-         align=None,
-         owidth=None, ocolor=None,
-         shadow=None, scolor=None,
-         gcolor=None,
-         alpha=1.0,
-         anchor=None,
-         angle=0,
-         surf=_default_surf_sentinel,
-         cache=True):
+    Either anchor component is None if no option determines it.
 
+    """
     if topleft:
         left, top = topleft
     if bottomleft:
@@ -428,7 +783,52 @@ def draw(text, pos=None,
         raise ValueError("Unable to determine horizontal position")
     if y is None:
         raise ValueError("Unable to determine vertical position")
+    return x, y, hanchor, vanchor
+
+
+def _blitpos(tsurf, size0, x, y, hanchor, vanchor, angle):
+    """Return the point to blit tsurf to so that its anchor lands on (x, y).
+
+    size0 is the size of the text before it was rotated by angle.
+
+    """
+    if angle:
+        w0, h0 = size0
+        S, C = sin(radians(angle)), cos(radians(angle))
+        dx, dy = (0.5 - hanchor) * w0, (0.5 - vanchor) * h0
+        x += dx * C + dy * S - 0.5 * tsurf.get_width()
+        y += -dx * S + dy * C - 0.5 * tsurf.get_height()
+    else:
+        x -= hanchor * tsurf.get_width()
+        y -= vanchor * tsurf.get_height()
+    return int(round(x)), int(round(y))
+
+
+_default_surf_sentinel = ()
 
+
+def draw(text, pos=None,
+         fontname=None, fontsize=None, sysfontname=None,
+         antialias=True, bold=None, italic=None, underline=None,
+         color=None, background=None,
+         top=None, left=None, bottom=None, right=None,
+         topleft=None, bottomleft=None, topright=None, bottomright=None,
+         midtop=None, midleft=None, midbottom=None, midright=None,
+         center=None, centerx=None, centery=None,
+         width=None,	widthem=None, lineheight=None, strip=None,
+         align=None,
+         owidth=None, ocolor=None,
+         shadow=None, scolor=None,
+         gcolor=None,
+         alpha=1.0,
+         anchor=None,
+         angle=0,
+         surf=_default_surf_sentinel,
+         cache=True):
+
+    x, y, hanchor, vanchor = _resolvepos(
+        pos, anchor, top, left, bottom, right, topleft, bottomleft, topright, bottomright,
+        midtop, midleft, midbottom, midright, center, centerx, centery)
     if align is None:
         align = hanchor
     if hanchor is None:
@@ -440,17 +840,12 @@ def draw(text, pos=None,
                     strip, color, background, antialias, ocolor, owidth, scolor, shadow, gcolor, alpha, align,
                     lineheight, angle, cache)
     angle = _resolveangle(angle)
+    size0 = None
     if angle:
-        w0, h0 = _unrotated_size[(tsurf.get_size(), angle, text)]
-        S, C = sin(radians(angle)), cos(radians(angle))
-        dx, dy = (0.5 - hanchor) * w0, (0.5 - vanchor) * h0
-        x += dx * C + dy * S - 0.5 * tsurf.get_width()
-        y += -dx * S + dy * C - 0.5 * tsurf.get_height()
-    else:
-        x -= hanchor * tsurf.get_width()
-        y -= vanchor * tsurf.get_height()
-    x = int(round(x))
-    y = int(round(y))
+        size0 = getsurf(text, fontname, fontsize, sysfontname, bold, italic, underline, width, widthem,
+                        strip, color, background, antialias, ocolor, owidth, scolor, shadow, gcolor,
+                        alpha, align, lineheight, 0, cache).get_size()
+    x, y = _blitpos(tsurf, size0, x, y, hanchor, vanchor, angle)
 
     if surf is _default_surf_sentinel:
         surf = pygame.display.get_surface()
@@ -463,6 +858,123 @@ def draw(text, pos=None,
     return tsurf, (x, y)
 
 
+class TextStyle:
+    """A set of text options that is resolved once and then reused.
+
+    getsurf() and draw() apply defaults and normalise colours, sizes and
+    alignment on every call. A style does that work when it is created, so
+    drawing with it only has to look the text up in the cache, e.g. ::
+
+        LABEL = TextStyle(fontname="bubblegum", fontsize=24, color="yellow")
+        LABEL.draw("Score: %d" % score, topleft=(10, 10))
+
+    A style takes the same options as getsurf(), along with a default anchor
+    for draw(). Defaults such as DEFAULT_FONT_NAME are read when the style is
+    created, so later changes to them do not affect it.
+
+    """
+    def __init__(self, fontname=None, fontsize=None, sysfontname=None, bold=None, italic=None,
+                 underline=None, width=None, widthem=None, strip=None, color=None,
+                 background=None, antialias=True, ocolor=None, owidth=None, scolor=None,
+                 shadow=None, gcolor=None, alpha=1.0, align=None, lineheight=None, angle=0,
+                 anchor=None):
+        self.options = dict(
+            fontname=fontname, fontsize=fontsize, sysfontname=sysfontname, bold=bold,
+            italic=italic, underline=underline, width=width, widthem=widthem, strip=strip,
+            color=color, background=background, antialias=antialias, ocolor=ocolor,
+            owidth=owidth, scolor=scolor, shadow=shadow, gcolor=gcolor, alpha=alpha,
+            align=align, lineheight=lineheight, angle=angle)
+        self.anchor = anchor
+        options = _resolveoptions(**self.options)
+        # The surface cache key, less the text and the alignment
+        self._head = options[:18]
+        self._defaultalign = options[18]
+        self._lineheight = options[19]
+        self.angle = options[20]
+        # Without an explicit alignment, text aligns with its anchor
+        self._align = None if align is None else self._defaultalign
+
+    def __repr__(self):
+        options = ', '.join(
+            '%s=%r' % (k, v) for k, v in sorted(self.options.items())
+            if v is not None
+        )
+        return '<TextStyle %s>' % options
+
+    def _getsurf(self, text, align, angle):
+        key = ('surf', text) + self._head + (align, self._lineheight, angle)
+        surf = _cache.get(key)
+        if surf is None:
+            options = dict(self.options, align=align, angle=angle)
+            surf = getsurf(text, **options)
+        return surf
+
+    def getsurf(self, text):
+        """Return a surface with text rendered in this style."""
+        align = self._defaultalign if self._align is None else self._align
+        return self._getsurf(text, align, self.angle)
+
+    def getfont(self):
+        """Return the Font this style renders text with."""
+        fontname, fontsize, sysfontname, bold, italic, underline = self._head[:6]
+        return getfont(fontname, fontsize, sysfontname, bold, italic, underline)
+
+    def getlines(self, text):
+        """Return where each line of text is on the surface from getsurf().
+
+        Each line is given as (line, x, y): its text and the top left of the
+        line on the surface. Outlines and shadows are not allowed for.
+
+        """
+        fontname, fontsize, sysfontname, bold, italic, underline, width, widthem, strip = self._head[:9]
+        font = getfont(fontname, fontsize, sysfontname, bold, italic, underline)
+        lines = wrap(text, fontname, fontsize, sysfontname, bold, italic, underline,
+                     width=width, widthem=widthem, strip=strip)
+        align = self._defaultalign if self._align is None else self._align
+        widths = [font.size(line)[0] for line in lines]
+        w = max(widths)
+        linesize = font.get_linesize() * self._lineheight
+        return [
+            (line, int(round(align * (w - lw))), int(round(k * linesize)))
+            for k, (line, lw) in enumerate(zip(lines, widths))
+        ]
+
+    def draw(self, text, pos=None,
+             top=None, left=None, bottom=None, right=None,
+             topleft=None, bottomleft=None, topright=None, bottomright=None,
+             midtop=None, midleft=None, midbottom=None, midright=None,
+             center=None, centerx=None, centery=None,
+             anchor=None, surf=_default_surf_sentinel):
+        """Draw text in this style, positioned as for draw()."""
+        x, y, hanchor, vanchor = _resolvepos(
+            pos, anchor or self.anchor, top, left, bottom, right, topleft, bottomleft,
+            topright, bottomright, midtop, midleft, midbottom, midright,
+            center, centerx, centery)
+        align = self._align
+        if align is None:
+            align = self._defaultalign if hanchor is None else hanchor
+        if hanchor is None:
+            hanchor = DEFAULT_ANCHOR[0]
+        if vanchor is None:
+            vanchor = DEFAULT_ANCHOR[1]
+
+        tsurf = self._getsurf(text, align, self.angle)
+        size0 = None
+        if self.angle:
+            size0 = self._getsurf(text, align, 0).get_size()
+        x, y = _blitpos(tsurf, size0, x, y, hanchor, vanchor, self.angle)
+
+        if surf is _default_surf_sentinel:
+            surf = pygame.display.get_surface()
+        if surf is not None:
+            surf.blit(tsurf, (x, y))
+
+        if AUTO_CLEAN:
+            clean()
+
+        return tsurf, (x, y)
+
+
 def drawbox(text, rect, fontname=None, sysfontname=None, lineheight=None, anchor=None,
             bold=None, italic=None, underline=None, strip=None, **kwargs):
     if fontname is None:
@@ -480,16 +992,4 @@ def drawbox(text, rect, fontname=None, sysfontname=None, lineheight=None, anchor
 
 
 def clean():
-    global _surf_size_total
-    memory_limit = MEMORY_LIMIT_MB * (1 << 20)
-    if _surf_size_total < memory_limit:
-        return
-    memory_limit *= MEMORY_REDUCTION_FACTOR
-    keys = sorted(_surf_cache, key=_surf_tick_usage.get)
-    for key in keys:
-        w, h = _surf_cache[key].get_size()
-        del _surf_cache[key]
-        del _surf_tick_usage[key]
-        _surf_size_total -= 4 * w * h
-        if _surf_size_total < memory_limit:
-            break
+    _cache.evict(MEMORY_LIMIT_MB * (1 << 20))
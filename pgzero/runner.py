@@ -4,6 +4,7 @@ pygame.init()
 
 import os
 import sys
+import asyncio
 import warnings
 from optparse import OptionParser
 from types import ModuleType
@@ -62,6 +63,12 @@ def main():
         _substitute_full_framework_python()
 
     parser = OptionParser()
+    parser.add_option(
+        '--asyncio',
+        action='store_true',
+        help="Run the game loop as an asyncio task, so that game code can "
+             "use coroutines."
+    )
     options, args = parser.parse_args()
 
     if len(args) != 1:
@@ -86,4 +93,8 @@ def main():
     mod.__dict__.update(builtins.__dict__)
     sys.modules[name] = mod
     exec(code, mod.__dict__)
-    PGZeroGame(mod).run()
+    game = PGZeroGame(mod)
+    if options.asyncio:
+        asyncio.run(game.run_async())
+    else:
+        game.run()
@@ -5,6 +5,11 @@ from .rect import RECT_CLASSES
 from . import loaders
 
 
+# If the area drawn in a frame covers more than this fraction of the screen,
+# update the whole display rather than just the drawn rectangles.
+FLIP_COVERAGE = 0.5
+
+
 def round_pos(pos):
     """Round a tuple position so it can be used for drawing."""
     x, y = pos
@@ -17,70 +22,274 @@ def make_color(arg):
     return tuple(pygame.Color(arg))
 
 
+def merge_rects(rects):
+    """Merge overlapping rectangles into their unions.
+
+    Return a list of rectangles, no two of which overlap.
+
+    """
+    merged = []
+    for r in rects:
+        r = pygame.Rect(r)
+        i = r.collidelist(merged)
+        while i != -1:
+            r.union_ip(merged.pop(i))
+            i = r.collidelist(merged)
+        merged.append(r)
+    return merged
+
+
 class SurfacePainter:
     """Interface to pygame.draw that is bound to a surface."""
 
     def __init__(self, screen):
         self._screen = screen
 
-    @property
-    def _surf(self):
-        return self._screen.surface
-
     def line(self, start, end, color):
         """Draw a line from start to end."""
         start = round_pos(start)
         end = round_pos(end)
-        pygame.draw.line(self._surf, make_color(color), start, end, 1)
+        (x0, y0), (x1, y1) = start, end
+        rect = pygame.Rect(
+            min(x0, x1), min(y0, y1), abs(x1 - x0) + 1, abs(y1 - y0) + 1
+        )
+        self._screen._draw(
+            rect, False, pygame.draw.line, make_color(color), start, end, 1
+        )
 
     def circle(self, pos, radius, color):
         """Draw a circle."""
-        pos = round_pos(pos)
-        pygame.draw.circle(self._surf, make_color(color), pos, radius, 1)
+        self._circle(pos, radius, color, 1)
 
     def filled_circle(self, pos, radius, color):
         """Draw a filled circle."""
-        pos = round_pos(pos)
-        pygame.draw.circle(self._surf, make_color(color), pos, radius, 0)
+        self._circle(pos, radius, color, 0)
+
+    def _circle(self, pos, radius, color, width):
+        x, y = pos = round_pos(pos)
+        rect = pygame.Rect(x - radius, y - radius, 2 * radius + 1, 2 * radius + 1)
+        self._screen._draw(
+            rect, False, pygame.draw.circle, make_color(color), pos, radius, width
+        )
 
     def rect(self, rect, color):
         """Draw a rectangle."""
         if not isinstance(rect, RECT_CLASSES):
             raise TypeError("screen.draw.rect() requires a rect to draw")
-        pygame.draw.rect(self._surf, make_color(color), rect, 1)
+        rect = pygame.Rect(rect)
+        self._screen._draw(
+            rect, False, pygame.draw.rect, make_color(color), rect, 1
+        )
 
     def filled_rect(self, rect, color):
         """Draw a filled rectangle."""
         if not isinstance(rect, RECT_CLASSES):
             raise TypeError("screen.draw.filled_rect() requires a rect to draw")
-        pygame.draw.rect(self._surf, make_color(color), rect, 0)
+        rect = pygame.Rect(rect)
+        self._screen._draw(
+            rect, True, pygame.draw.rect, make_color(color), rect, 0
+        )
+
+    def text(self, *args, style=None, **kwargs):
+        """Draw text to the screen.
 
-    def text(self, *args, **kwargs):
-        """Draw text to the screen."""
+        If style is a TextStyle, the text is drawn in that style and only
+        positioning options may be given.
+
+        """
         #FIXME: expose ptext parameters, for autocompletion and autodoc
-        ptext.draw(*args, surf=self._surf, **kwargs)
+        if style is None:
+            tsurf, pos = ptext.draw(*args, surf=None, **kwargs)
+        else:
+            tsurf, pos = style.draw(*args, surf=None, **kwargs)
+        # Text surfaces are either cached and never changed, or new
+        self._screen._blit(tsurf, pos, None, False)
 
     def textbox(self, *args, **kwargs):
         """Draw text to the screen, wrapped to fit a box"""
         #FIXME: expose ptext parameters, for autocompletion and autodoc
-        ptext.drawbox(*args, surf=self._surf, **kwargs)
+        tsurf, pos = ptext.drawbox(*args, surf=None, **kwargs)
+        self._screen._blit(tsurf, pos, None, False)
 
 
 class Screen:
-    """Interface to the screen."""
-    def __init__(self, surface):
+    """Interface to the screen.
+
+    The screen keeps track of the rectangles that have been drawn to, so
+    that only those parts of the display need to be updated.
+
+    If retained is True, drawing is recorded rather than done straight away.
+    At the end of the frame the recorded drawing is compared with the last
+    frame's, and only the areas where it differs are redrawn. Anything not
+    drawn over an opaque fill from earlier in the frame depends on what was
+    on the screen before, so is always redrawn. So is any blit of a Surface
+    other than a loaded image or rendered text, because the game may have
+    changed it in place since the last frame.
+
+    """
+    def __init__(self, surface, retained=True):
+        self.retained = retained
         self.surface = surface
         self.width, self.height = surface.get_size()
 
+    @property
+    def surface(self):
+        """The Pygame Surface for the screen.
+
+        We can't tell what is drawn directly to this, so the whole display
+        is updated in any frame in which it is used.
+
+        """
+        self._flush()
+        self._dirty_all = True
+        return self._surface
+
+    @surface.setter
+    def surface(self, surface):
+        self._surface = surface
+        self._dirty = []
+        self._dirty_all = True
+        self._last = None
+        self._begin_frame()
+
+    def _touch(self, rect):
+        """Record that rect has been drawn to."""
+        if not self._dirty_all:
+            self._dirty.append(rect)
+
+    def _begin_frame(self):
+        """Start recording the next frame, if it can be recorded."""
+        surf = self._surface
+        if self.retained and surf.get_clip() == surf.get_rect():
+            # The display list, as (rect, func, args) commands
+            self._commands = []
+            # The opaque areas drawn so far in this frame
+            self._bases = []
+            # Areas drawn outside those, which must be redrawn every frame
+            self._exposed = []
+            # Areas drawn from Surfaces that might have changed, likewise
+            self._volatile = []
+        else:
+            self._commands = None
+
+    def _draw(self, rect, opaque, func, *args, volatile=False):
+        """Draw within rect by calling func(surface, *args).
+
+        If the frame is being recorded the call is added to the display list
+        instead. If volatile is True, the call's result may differ from last
+        frame's even if its arguments compare equal, so it is always redrawn.
+
+        """
+        rect = rect.clip(self._surface.get_rect())
+        if not rect:
+            return
+        commands = self._commands
+        if commands is not None:
+            if opaque:
+                self._bases.append(rect)
+            elif not any(base.contains(rect) for base in self._bases):
+                self._exposed.append(rect)
+            if volatile:
+                self._volatile.append(rect)
+            commands.append((rect, func, args))
+            return
+        func(self._surface, *args)
+        self._touch(rect)
+
+    def _replay(self, commands):
+        """Draw the commands that differ from the last frame's."""
+        surf = self._surface
+        last = self._last
+        if last is None:
+            for rect, func, args in commands:
+                func(surf, *args)
+                self._touch(rect)
+            return
+
+        # Skip the commands the two frames start and end with in common
+        n = min(len(last), len(commands))
+        start = 0
+        while start < n and last[start] == commands[start]:
+            start += 1
+        end = 0
+        while end < n - start and last[-1 - end] == commands[-1 - end]:
+            end += 1
+        old = last[start:len(last) - end]
+        new = commands[start:len(commands) - end]
+        if len(old) == len(new):
+            changed = [(a, b) for a, b in zip(old, new) if a != b]
+            damage = [c[0] for pair in changed for c in pair]
+        else:
+            damage = [c[0] for c in old + new]
+        damage.extend(self._exposed)
+        damage.extend(self._volatile)
+
+        for area in merge_rects(damage):
+            surf.set_clip(area)
+            for rect, func, args in commands:
+                if area.colliderect(rect):
+                    func(surf, *args)
+            self._touch(area)
+        surf.set_clip(None)
+
+    def _flush(self):
+        """Draw anything recorded so far, and stop recording the frame."""
+        if self._commands is not None:
+            self._replay(self._commands)
+            self._commands = None
+        self._last = None
+
+    def _update_display(self):
+        """Update the parts of the display that have been drawn to."""
+        commands = self._commands
+        if commands is not None:
+            self._replay(commands)
+        self._last = commands
+        self._begin_frame()
+
+        rects = merge_rects(self._dirty)
+        w, h = self._surface.get_size()
+        coverage = sum(r.width * r.height for r in rects) / (w * h)
+        if self._dirty_all or coverage > FLIP_COVERAGE:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
+        self._dirty = []
+        self._dirty_all = False
+
     def clear(self):
         """Clear the screen to black."""
         self.fill((0, 0, 0))
 
     def fill(self, color):
         """Fill the screen with a colour."""
-        self.surface.fill(make_color(color))
+        self._draw(
+            self._surface.get_rect(), True,
+            pygame.Surface.fill, make_color(color)
+        )
+
+    def set_clip(self, rect=None):
+        """Restrict drawing to the given rect, or lift the restriction."""
+        self._flush()
+        self._surface.set_clip(rect)
+
+    def scroll(self, dx=0, dy=0, rect=None):
+        """Move the contents of the screen, or of rect, by (dx, dy).
 
-    def blit(self, image, pos):
+        This is much cheaper than redrawing them. Areas uncovered by the
+        move are left unchanged, so will need to be redrawn.
+
+        """
+        self._flush()
+        if rect is None:
+            self._surface.scroll(dx, dy)
+            self._dirty_all = True
+        else:
+            rect = pygame.Rect(rect).clip(self._surface.get_rect())
+            self._surface.subsurface(rect).scroll(dx, dy)
+            self._touch(rect)
+
+    def blit(self, image, pos, area=None):
         """Draw a sprite onto the screen.
 
         "blit" is an archaic name for this operation, but one that is is still
@@ -94,11 +303,26 @@ class Screen:
                     will be positioned. This may be given as a pair of
                     coordinates or as a Rect. If a Rect is given the sprite
                     will be drawn at ``rect.topleft``.
+        :param area: If given, the rect of the sprite to draw; only this part
+                     of it will be copied to the screen.
 
         """
         if isinstance(image, str):
             image = loaders.images.load(image)
-        self.surface.blit(image, pos)
+        self._blit(image, pos, area, not loaders.images.is_loaded(image))
+
+    def _blit(self, image, pos, area, volatile):
+        """Draw image at pos; volatile is as for _draw()."""
+        pos = pos[0], pos[1]
+        if area is None:
+            size = image.get_size()
+        else:
+            area = pygame.Rect(area)
+            size = area.size
+        self._draw(
+            pygame.Rect(pos, size), False, pygame.Surface.blit,
+            image, pos, area, volatile=volatile
+        )
 
     @property
     def draw(self):
@@ -86,7 +86,9 @@ CONSTS = [
     'TITLE',
     'WIDTH',
     'HEIGHT',
-    'ICON'
+    'ICON',
+    'FPS',
+    'UPDATE_RATE',
 ]
 
 # Available parameters for each hook
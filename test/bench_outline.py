@@ -0,0 +1,57 @@
+"""Time outlined text with NumPy against the per-point blits without it.
+
+Run from the top of the repository:
+
+    python test/bench_outline.py
+
+"""
+import os
+import sys
+import timeit
+from math import ceil
+from pathlib import Path
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pygame
+
+from pgzero import ptext
+
+
+FONT = str(Path(__file__).parent.parent / 'fonts' / 'travelling_typewriter.ttf')
+TEXT = 'A Death At Sea'
+OWIDTHS = [0.5, 1, 2, 4, 8]
+
+
+def time_outline(owidth, number=10, repeat=7):
+    """Return the best time in ms to render TEXT outlined, without caching."""
+    def render():
+        ptext.getsurf(
+            TEXT, fontname=FONT, fontsize=64, color='white',
+            owidth=owidth, ocolor='red', cache=False
+        )
+    return min(timeit.repeat(render, number=number, repeat=repeat)) / number * 1000
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((100, 100))
+    if ptext.numpy is None:
+        sys.exit("NumPy is needed to compare the two ways of drawing outlines.")
+    numpy = ptext.numpy
+    print('{:>7} {:>6} {:>10} {:>10}'.format('owidth', 'px', 'blits ms', 'numpy ms'))
+    for owidth in OWIDTHS:
+        opx = ceil(owidth * 64 * ptext.OUTLINE_UNIT)
+        ptext.numpy = None
+        try:
+            blits = time_outline(owidth)
+        finally:
+            ptext.numpy = numpy
+        print('{:>7} {:>6} {:>10.2f} {:>10.2f}'.format(
+            owidth, opx, blits, time_outline(owidth)
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+import os
+from types import ModuleType
+from unittest import TestCase
+from unittest.mock import patch
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+from pgzero import game
+
+
+class ResizeWindowTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+
+    def setUp(self):
+        patcher = patch.multiple(game, _game=None, _pending_size=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_before_game_created(self):
+        """Resizing while the module loads sizes the window on start."""
+        mod = ModuleType('resize_before')
+        mod.WIDTH, mod.HEIGHT = 800, 600
+        game.resize_window(320, 240)
+        g = game.PGZeroGame(mod)
+        self.assertEqual((mod.WIDTH, mod.HEIGHT), (320, 240))
+        g.reinit_screen()
+        self.assertEqual(g.screen.get_size(), (320, 240))
+
+    def test_after_game_created(self):
+        mod = ModuleType('resize_after')
+        g = game.PGZeroGame(mod)
+        g.reinit_screen()
+        game.resize_window(400, 300)
+        self.assertEqual((mod.WIDTH, mod.HEIGHT), (400, 300))
+        g.reinit_screen()
+        self.assertEqual(g.screen.get_size(), (400, 300))
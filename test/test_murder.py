@@ -0,0 +1,78 @@
+import os
+import sys
+from pathlib import Path
+from types import ModuleType
+from unittest import TestCase
+from unittest.mock import patch
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from pgzero import builtins, game, loaders, music
+from pgzero.screen import Screen
+
+
+ROOT = Path(__file__).parent.parent
+GAME = ROOT / 'murder.py'
+
+
+def load_game():
+    """Load murder.py as the runner does, without running it.
+
+    Music is not played, so the tests don't need an audio device or the
+    music files.
+
+    """
+    loaders.set_root(str(GAME))
+    mod = ModuleType('murder')
+    mod.__file__ = str(GAME)
+    mod.__dict__.update(builtins.__dict__)
+    sys.modules['murder'] = mod
+    code = compile(GAME.read_text(encoding='utf8'), 'murder.py', 'exec')
+    with patch.object(music, 'play'):
+        exec(code, mod.__dict__)
+    return mod
+
+
+class DeckLayerTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+        pygame.display.set_mode((800, 600))
+        cls.murder = load_game()
+
+    def draw_live(self, deck, ox):
+        """Draw deck as the layer should show it, using Actor.draw()."""
+        m = self.murder
+        surf = pygame.Surface(m.deck_layer[1].get_size()).convert()
+        surf.fill(m.BLACK)
+        surf.blit(loaders.images.load(deck.image), (-ox, 0))
+        game.screen = Screen(surf, retained=False)
+        for a in deck.actors:
+            a.pos = a.real_x - ox, 186 - m.PANEL.top
+            a.draw()
+        return surf
+
+    def test_layer_matches_actor_draw(self):
+        """The cached deck layer puts NPCs where Actor.draw() does."""
+        m = self.murder
+        odd = [
+            a for deck in m.decks for a in deck.actors
+            if a.width % 2
+        ]
+        self.assertTrue(odd, "no odd-width NPC to test rounding with")
+        for deck in m.decks:
+            m.current_deck = deck
+            m.build_deck_layer()
+            key, layer, ox = m.deck_layer
+            before = [a.topleft for a in deck.actors]
+            m.build_deck_layer()
+            self.assertEqual([a.topleft for a in deck.actors], before)
+            expected = self.draw_live(deck, ox)
+            self.assertEqual(
+                pygame.image.tostring(layer, 'RGB'),
+                pygame.image.tostring(expected, 'RGB'),
+                "deck layer differs for %s" % deck.image
+            )
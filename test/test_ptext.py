@@ -0,0 +1,134 @@
+import os
+from pathlib import Path
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from pgzero import ptext
+
+
+FONT = str(Path(__file__).parent.parent / 'fonts' / 'travelling_typewriter.ttf')
+WHITE = (255, 255, 255, 255)
+
+
+def flatten(surf):
+    """Return the pixels of surf composited over black."""
+    out = pygame.Surface(surf.get_size())
+    out.fill((0, 0, 0))
+    out.blit(surf, (0, 0))
+    return pygame.image.tostring(out, 'RGB')
+
+
+class GlyphAtlasTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+        pygame.display.set_mode((100, 100))
+
+    def assertRendersLikeFont(self, fontsize, antialias, text):
+        font = ptext.getfont(FONT, fontsize)
+        atlas = ptext.getatlas(
+            FONT, fontsize, None, False, False, antialias, WHITE
+        )
+        expected = font.render(text, antialias, WHITE[:3]).convert_alpha()
+        surf = atlas.render(text)
+        self.assertEqual(surf.get_size(), expected.get_size())
+        self.assertEqual(flatten(surf), flatten(expected))
+
+    def test_no_antialias(self):
+        """Text without antialiasing has no background copied in."""
+        self.assertRendersLikeFont(32, False, 'Death at Sea, gyp!')
+
+    def test_antialias(self):
+        self.assertRendersLikeFont(32, True, 'Death at Sea, gyp!')
+
+    def test_tall_glyphs(self):
+        """Glyphs taller than the font's height are not clipped."""
+        font = ptext.getfont(FONT, 18)
+        self.assertGreater(
+            font.render('g', True, WHITE[:3]).get_height(), font.get_height()
+        )
+        for antialias in (True, False):
+            self.assertRendersLikeFont(18, antialias, 'gypsy jig')
+
+
+@skipIf(numpy is None, "NumPy is not installed")
+class OutlineTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+        pygame.display.set_mode((100, 100))
+
+    def render(self, owidth):
+        surf = ptext.getsurf(
+            'Death at Sea', fontname=FONT, fontsize=48, color='white',
+            owidth=owidth, ocolor='red', cache=False
+        )
+        return numpy.array(pygame.surfarray.array_alpha(surf), int)
+
+    def test_outline_matches_blits(self):
+        """The NumPy outline looks like blitting a copy at each point."""
+        for owidth in (0.5, 2, 6):
+            spread = self.render(owidth)
+            with patch.object(ptext, 'numpy', None):
+                blitted = self.render(owidth)
+            self.assertEqual(spread.shape, blitted.shape)
+            diff = abs(spread - blitted)
+            self.assertLessEqual(diff.max(), 4)
+            self.assertLess(diff.mean(), 0.1)
+
+
+class WrapTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+        cls.width = ptext.getfont(FONT, 18).size('aaa  bbb')[0]
+
+    def wrap(self, text, width=None, strip=True, **kwargs):
+        return ptext.wrap(
+            text, FONT, 18, width=width or self.width, strip=strip, **kwargs
+        )
+
+    def test_leading_spaces(self):
+        """Leading spaces are kept, even on a single word."""
+        self.assertEqual(self.wrap('  the', 1000), ['  the'])
+        self.assertEqual(self.wrap('  the', 1000, strip=False), ['  the'])
+        self.assertEqual(self.wrap('  the cat', 1000), ['  the cat'])
+
+    def test_strip(self):
+        """Stripping drops the spaces at breaks and the end of the text."""
+        self.assertEqual(self.wrap('aaa  bbb   ccc'), ['aaa  bbb', 'ccc'])
+        self.assertEqual(self.wrap('  aaa bbb ccc  '), ['  aaa', 'bbb ccc'])
+        self.assertEqual(self.wrap('aaa   ', 1000), ['aaa'])
+
+    def test_no_strip(self):
+        """Without stripping, spaces stay with the lines they follow."""
+        self.assertEqual(
+            self.wrap('aaa  bbb   ccc', strip=False), ['aaa  bbb', '   ccc']
+        )
+        self.assertEqual(
+            self.wrap('  aaa bbb ccc  ', strip=False), ['  aaa ', 'bbb ccc ']
+        )
+        self.assertEqual(self.wrap('aaa   ', 1000, strip=False), ['aaa  '])
+
+    def test_overhang(self):
+        """Lines in bold italic are filled up to the width exactly."""
+        font = ptext.getfont(FONT, 42, None, True, True)
+        text = 'Watch the WAVES with AVA'
+        width = font.size('Watch the WAVES')[0]
+        for strip, rest in ((True, 'with AVA'), (False, ' with AVA')):
+            self.assertEqual(
+                ptext.wrap(
+                    text, FONT, 42, bold=True, italic=True, width=width,
+                    strip=strip
+                ),
+                ['Watch the WAVES', rest]
+            )